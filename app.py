@@ -1,12 +1,15 @@
 # app.py
 from __future__ import annotations
 import os
+import importlib
 import time
 import logging
-import json
-import queue
 import threading
-from typing import Optional, List, Dict, Any
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, get_origin
 
 import customtkinter as ctk
 
@@ -17,23 +20,102 @@ from controllers.settings_controller import SettingsController
 from controllers.preset_controller import PresetController
 from ui.confirm_dialog import ConfirmationDialog
 from ui.save_preset_dialog import SavePresetDialog
-from ui.logging_utils import QueueLogHandler
+from ui.logging_utils import LogBuffer, QueueLogHandler
 from ui.port_select_dialog import PortSelectDialog
 from controllers.app_state import AppState
+from controllers.io_worker import DeviceIOWorker
+from controllers.json_codec import dumps_pretty
 
 from ui.panels.base_panel import BasePanel
-from ui.panels.device_panel import DevicePanel
-from ui.panels.lora_panel import LoRaPanel
-from ui.panels.channels_panel import ChannelsPanel
-from ui.panels.power_panel import PowerPanel
-from ui.panels.position_panel import PositionPanel
-from ui.panels.display_panel import DisplayPanel
-from ui.panels.bluetooth_panel import BluetoothPanel
-from ui.panels.network_panel import NetworkPanel
-from ui.panels.modules_panel import ModulesPanel
 
 log = logging.getLogger(__name__)
 
+# Upper bound on lines kept in the log box; older lines are trimmed from the top
+MAX_LOG_LINES = 5000
+# Max queued log records moved into the log box per drain
+LOG_DRAIN_BATCH = 256
+# How long a detect job waits for the user to pick a port before giving up
+PORT_DIALOG_TIMEOUT_S = 300
+
+# Left-hand panels in display order: (module, class). Imported lazily in _build_left_sections.
+PANEL_REGISTRY = (
+    ("ui.panels.device_panel", "DevicePanel"),
+    ("ui.panels.lora_panel", "LoRaPanel"),
+    ("ui.panels.channels_panel", "ChannelsPanel"),
+    ("ui.panels.power_panel", "PowerPanel"),
+    ("ui.panels.position_panel", "PositionPanel"),
+    ("ui.panels.display_panel", "DisplayPanel"),
+    ("ui.panels.bluetooth_panel", "BluetoothPanel"),
+    ("ui.panels.network_panel", "NetworkPanel"),
+    ("ui.panels.modules_panel", "ModulesPanel"),
+)
+# Panels built before the window first draws; the rest are built on idle
+EAGER_PANELS = 3
+
+@lru_cache(maxsize=1)
+def _blank_model() -> DeviceModel:
+    """Validated empty DeviceModel, built once; shared, so callers must treat it as read-only."""
+    return DeviceModel.model_validate({
+        "Device": {},
+        "UserInfo": {},
+        "Lora": {},
+        "Power": {},
+        "Position": {},
+        "Display": {},
+        "BlueTooth": {},
+        "Network": {},
+        "ModuleConfig": {},
+        "MeshChannels": [],
+        "MetaData": {},
+        "MyInfo": {},
+    })
+
+# Per-section blanking for the _make_blank_model fallback, resolved once from the model
+# schema: list fields get a fresh list (factory), every other section is set to None
+_BLANK_SECTION_FACTORIES = MappingProxyType({
+    name: (list if get_origin(field.annotation) is list else None)
+    for name, field in DeviceModel.model_fields.items()
+})
+
+# Apply report summary tables (see App._summarize_apply_report); read-only views
+_STATUS_MAP = MappingProxyType({
+    "ok": "Success",
+    "error": "Error",
+    "timeout": "Timeout",
+    "no_change": "No change",
+})
+
+_NAME_MAP = MappingProxyType({
+    "device": "Device",
+    "owner": "Owner",
+    "lora": "LoRa",
+    "power": "Power",
+    "position": "Position",
+    "display": "Display",
+    "bluetooth": "Bluetooth",
+    "network": "Network",
+    "channels": "Channels",
+    "modules": "Modules",
+})
+
+_PREFERRED_ORDER = (
+    "device", "owner", "lora", "power", "position", "display",
+    "bluetooth", "network", "channels", "modules",
+)
+_SECTION_ORDER = MappingProxyType({k: i for i, k in enumerate(_PREFERRED_ORDER)})
+
+
+def _pretty_status(s: str | None) -> str:
+    if not s:
+        return "Unknown"
+    # Writer statuses are already lowercase constants; only normalize on a miss
+    v = _STATUS_MAP.get(s)
+    if v is not None:
+        return v
+    s = s.lower()
+    return _STATUS_MAP.get(s) or s.title()
+
+
 class App(ctk.CTk):
     def __init__(self, explicit_port: Optional[str] = None):
         super().__init__()
@@ -47,17 +129,33 @@ class App(ctk.CTk):
         except Exception:
             pass
 
+        # Last state set per button via _set_state()
+        self._btn_state_cache: Dict[int, str] = {}
+        self._preset_buttons_enabled: Optional[bool] = None
+        self._preset_values_cache: tuple[str, ...] = ()
+        self._status_text = ""
+        self._device_info_text = ""
+
         # Controllers
         # Load preferred port if not explicitly provided
         if not explicit_port:
             explicit_port = AppState.get_preferred_port() or None
         self.settings = SettingsController(explicit_port=explicit_port)
+        # Callables run (in order) on disconnect to release serial/device resources
+        self._resource_closers: List[Callable[[], None]] = []
+        self.register_closer(self.settings.close)
+        # Short-lived controllers opened by workers; closed by the worker or, failing that, on disconnect
+        self._closeables: List[Any] = []
         self._connected_port: Optional[str] = None
         self._orig_model: Optional[DeviceModel] = None
+        # Blocking device work (detect/apply) runs on one serialized I/O worker
+        self._io = DeviceIOWorker()
+        self._io_future: Optional[Future] = None
+        self._io_cancel: Optional[threading.Event] = None
 
         # Logging -> UI queue
-        self.log_q: "queue.Queue[str]" = queue.Queue()
-        qh = QueueLogHandler(self.log_q)
+        self.log_buf = LogBuffer(tk_widget=self)
+        qh = QueueLogHandler(self.log_buf)
         qh.setLevel(logging.INFO)
         root_logger = logging.getLogger()
         try:
@@ -113,6 +211,10 @@ class App(ctk.CTk):
         self.log_box = ctk.CTkTextbox(self.right, height=360)
         self.log_box.grid(row=3, column=0, sticky="nsew", padx=8, pady=(0, 8))
         self.log_box.configure(state="disabled")
+        self._log_lines = 0
+        self._drain_pending = False
+        self._hidden_logs: "deque[str]" = deque(maxlen=MAX_LOG_LINES)
+        self.log_box.bind("<Map>", lambda e: self._flush_hidden_logs(), add=True)
 
         # Bottom progress bar under the log box
         self.progress_bar = ctk.CTkProgressBar(self.right, mode="indeterminate")
@@ -122,11 +224,20 @@ class App(ctk.CTk):
 
         # --- PANELS ---
         self.panels: Dict[str, BasePanel] = {}
-        self._build_left_sections()
+        self._pending_panels: List[tuple[str, str]] = list(PANEL_REGISTRY)
+        self._section_index: Optional[Dict[str, BasePanel]] = None
+        self._supports_section_panels: List[BasePanel] = []
+        self._panel_appliers: tuple = ()
+        # Panels are built once the main loop is idle so the window paints first
+        self._loading_lbl: Optional[ctk.CTkLabel] = ctk.CTkLabel(self.left_scroll, text="Loading panels…")
+        self._loading_lbl.pack(padx=8, pady=8)
+        self.after_idle(self._build_left_sections)
 
         self.presets = PresetController()
         self._refresh_preset_menu()
-        self.after(150, self._poll_logs)
+        self.bind("<<LogArrived>>", lambda e: self._drain_logs())
+        self.after(1000, self._log_watchdog)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         # If we booted with a preferred explicit port, auto-attempt connect once the UI is up
         try:
             if AppState.get_preferred_port():
@@ -151,15 +262,53 @@ class App(ctk.CTk):
         self.btn_delete_preset.pack(side="left", padx=(0, 4))
 
     def _build_left_sections(self):
-
-        panel_classes = [
-            DevicePanel, LoRaPanel, ChannelsPanel, PowerPanel, PositionPanel,
-            DisplayPanel, BluetoothPanel, NetworkPanel, ModulesPanel
-        ]
-        for panel_class in panel_classes:
+        """Build the first EAGER_PANELS panels, then the rest on the following idle callback."""
+        first, self._pending_panels = self._pending_panels[:EAGER_PANELS], self._pending_panels[EAGER_PANELS:]
+        if first:
+            self._build_panels(first)
+        if self._pending_panels:
+            self.after_idle(self._build_remaining_panels)
+
+    def _build_remaining_panels(self):
+        """Build any panels not built yet. Safe to call repeatedly; no-op once all are built."""
+        pending, self._pending_panels = self._pending_panels, []
+        if pending:
+            self._build_panels(pending)
+
+    def _build_panels(self, entries):
+        if self._loading_lbl is not None:
+            try:
+                self._loading_lbl.destroy()
+            except Exception:
+                pass
+            self._loading_lbl = None
+        for mod_name, cls_name in entries:
+            panel_class = getattr(importlib.import_module(mod_name), cls_name)
             panel = panel_class(self)
             panel.build(self.left_scroll)
             self.panels[panel.section_title] = panel
+        self._supports_section_panels = [p for p in self.panels.values() if hasattr(p, "supports_preset_section")]
+        # (model_sections, bound apply_model) per panel, in display order
+        self._panel_appliers = tuple((p.model_sections, p.apply_model) for p in self.panels.values())
+        self._invalidate_section_index()
+
+    def _invalidate_section_index(self):
+        """Called by panels whose preset sections change (e.g. channel rows added/removed)."""
+        self._section_index = None
+
+    def _get_section_index(self) -> Dict[str, BasePanel]:
+        """Map each preset section to the panel that currently binds it; built lazily."""
+        if self._section_index is None:
+            index: Dict[str, BasePanel] = {}
+            for panel in self.panels.values():
+                if hasattr(panel, "preset_bindings"):
+                    try:
+                        for sec in panel.preset_bindings().keys():
+                            index[sec] = panel
+                    except Exception:
+                        pass
+            self._section_index = index
+        return self._section_index
     
     # ---------------- Detect / Apply Model ----------------
     def _summarize_apply_report(self, report: dict) -> dict:
@@ -170,133 +319,79 @@ class App(ctk.CTk):
         - Normalize keys: duration_sec, fields_changed, response, errors
         - Keep Channels deletes/upserts nested but clearer
         """
-        def pretty_status(s: str | None) -> str:
-            if not s:
-                return "Unknown"
-            s = s.lower()
+        pretty_status = _pretty_status
+        order = _SECTION_ORDER
+
+        def _clip(s: str | None, n: int = 4000) -> str | None:
+            # Only slice (and allocate) when the text is actually over the cap
+            return s if s is None or len(s) <= n else s[:n]
+
+        def _xform_entry(d: dict, *, with_fields: bool = True) -> dict:
+            entry: dict[str, Any] = {
+                "status": pretty_status(d.get("status")),
+                "duration_sec": d.get("duration_s"),
+            }
+            if with_fields:
+                entry["fields_changed"] = d.get("fieldsChanged") or []
+            entry["response"] = _clip(d.get("stdout") or None)
+            entry["errors"] = d.get("stderr") or None
+            return entry
+
+        def _xform_channel(sec_data: dict) -> dict:
+            # Special structure for channels
             return {
-                "ok": "Success",
-                "error": "Error",
-                "timeout": "Timeout",
-                "no_change": "No change",
-            }.get(s, s.title())
-
-        name_map = {
-            "device": "Device",
-            "owner": "Owner",
-            "lora": "LoRa",
-            "power": "Power",
-            "position": "Position",
-            "display": "Display",
-            "bluetooth": "Bluetooth",
-            "network": "Network",
-            "channels": "Channels",
-            "modules": "Modules",
-        }
-
-        preferred_order = [
-            "device", "owner", "lora", "power", "position", "display",
-            "bluetooth", "network", "channels", "modules",
-        ]
+                "status": pretty_status(sec_data.get("status", "")),
+                "deleted": [{"index": d.get("index"), **_xform_entry(d, with_fields=False)}
+                            for d in (sec_data.get("deleted") or [])],
+                "upserts": [{"index": u.get("index"), **_xform_entry(u)}
+                            for u in (sec_data.get("upserts") or [])],
+            }
 
         sections = report.get("sections", {}) or {}
         errors = report.get("errors", []) or []
-        overall_status = pretty_status(report.get("status"))
-
-        # Build ordered output
-        out: dict[str, any] = {}
-        used = set()
-        for key in preferred_order:
-            if key in sections:
-                used.add(key)
-                sec_data = sections[key] or {}
-                sec_name = name_map.get(key, key.title())
-
-                if key == "channels":
-                    # Special structure for channels
-                    chan_out: dict[str, any] = {"status": pretty_status(sec_data.get("status", ""))}
-                    # Deleted
-                    del_list = []
-                    for d in sec_data.get("deleted") or []:
-                        del_list.append({
-                            "index": d.get("index"),
-                            "status": pretty_status(d.get("status")),
-                            "duration_sec": d.get("duration_s"),
-                            "response": (d.get("stdout") or "")[:4000],
-                            "errors": (d.get("stderr") or None),
-                        })
-                    # Upserts
-                    ups_list = []
-                    for u in sec_data.get("upserts") or []:
-                        ups_list.append({
-                            "index": u.get("index"),
-                            "status": pretty_status(u.get("status")),
-                            "duration_sec": u.get("duration_s"),
-                            "fields_changed": u.get("fieldsChanged") or [],
-                            "response": (u.get("stdout") or "")[:4000],
-                            "errors": (u.get("stderr") or None),
-                        })
-
-                    chan_out["deleted"] = del_list
-                    chan_out["upserts"] = ups_list
-                    out[sec_name] = chan_out
-                else:
-                    out[sec_name] = {
-                        "status": pretty_status(sec_data.get("status")),
-                        "duration_sec": sec_data.get("duration_s"),
-                        "fields_changed": sec_data.get("fieldsChanged") or [],
-                        "response": (sec_data.get("stdout") or "")[:4000],
-                        "errors": (sec_data.get("stderr") or None),
-                    }
-
-        # Append any sections we didn’t prefer-order
-        for key, sec_data in sections.items():
-            if key in used:
-                continue
-            sec_name = name_map.get(key, key.title())
-            if key == "channels":
-                # (Shouldn't happen if already handled above, but keep consistent)
-                chan_out: dict[str, any] = {"status": pretty_status(sec_data.get("status", ""))}
-                del_list = [{
-                    "index": d.get("index"),
-                    "status": pretty_status(d.get("status")),
-                    "duration_sec": d.get("duration_s"),
-                    "response": (d.get("stdout") or "")[:4000],
-                    "errors": (d.get("stderr") or None),
-                } for d in (sec_data.get("deleted") or [])]
-                ups_list = [{
-                    "index": u.get("index"),
-                    "status": pretty_status(u.get("status")),
-                    "duration_sec": u.get("duration_s"),
-                    "fields_changed": u.get("fieldsChanged") or [],
-                    "response": (u.get("stdout") or "")[:4000],
-                    "errors": (u.get("stderr") or None),
-                } for u in (sec_data.get("upserts") or [])]
-                chan_out["deleted"] = del_list
-                chan_out["upserts"] = ups_list
-                out[sec_name] = chan_out
-            else:
-                out[sec_name] = {
-                    "status": pretty_status(sec_data.get("status")),
-                    "duration_sec": sec_data.get("duration_s"),
-                    "fields_changed": sec_data.get("fieldsChanged") or [],
-                    "response": (sec_data.get("stdout") or "")[:4000],
-                    "errors": (sec_data.get("stderr") or None),
-                }
+
+        # Build ordered output: preferred sections first, unknown ones after in report order
+        out: dict[str, Any] = {}
+        for key, sec_data in sorted(sections.items(), key=lambda kv: order.get(kv[0], len(order))):
+            sec_data = sec_data or {}
+            sec_name = _NAME_MAP.get(key, key.title())
+            out[sec_name] = _xform_channel(sec_data) if key == "channels" else _xform_entry(sec_data)
 
         # Overall at the bottom
         out["Overall"] = {
-            "status": overall_status,
+            "status": pretty_status(report.get("status")),
             "errors": errors,
         }
         return out
 
 
+    def register_closer(self, closer: Callable[[], None]):
+        """Register a callable that releases a device resource when disconnecting."""
+        self._resource_closers.append(closer)
+
+    def _submit_io(self, fn) -> Future:
+        """
+        Queue a blocking device job on the I/O worker and remember it for cancellation.
+        fn receives a threading.Event that is set on disconnect; workers check it between device calls.
+        """
+        cancel = threading.Event()
+        fut = self._io.submit(fn, cancel)
+        self._io_future = fut
+        self._io_cancel = cancel
+        return fut
+
+    def _on_close(self):
+        try:
+            self._io.shutdown()
+        except Exception:
+            pass
+        self.destroy()
+
     def _on_detect_clicked(self):
         self._set_busy(True, "Detecting…")
-        threading.Thread(target=self._detect_worker, daemon=True).start()
+        self._submit_io(self._detect_worker)
             
-    def _detect_worker(self):
+    def _detect_worker(self, cancel: threading.Event):
         try:
             port = self.settings.connect_autodetect_if_single()
             if not port:
@@ -304,22 +399,26 @@ class App(ctk.CTk):
                 # If multiple candidates, ask user which to use
                 if err.get("code") == "multiple_candidates":
                     cands = err.get("candidates") or []
-                    selected_port_holder = {"port": ""}
-                    done = threading.Event()
+                    picked: Future = Future()
 
                     def _ask():
+                        result = ("", False)
                         try:
                             choice, remember = PortSelectDialog.ask(self, cands)
-                            selected_port_holder["port"] = choice or ""
-                            selected_port_holder["remember"] = bool(remember)
+                            result = (choice or "", bool(remember))
                         finally:
-                            done.set()
+                            picked.set_result(result)
 
-                    # Open dialog on UI thread
+                    # Open dialog on UI thread; the worker waits on the future, bounded so it cannot hang forever
                     self.after(0, _ask)
-                    # Block worker until user closes dialog
-                    done.wait()
-                    choice = selected_port_holder["port"] or ""
+                    try:
+                        choice, remember = picked.result(timeout=PORT_DIALOG_TIMEOUT_S)
+                    except FutureTimeout:
+                        self._log("Detect cancelled: no port selected in time.")
+                        self._set_busy(False, "")
+                        return
+                    if cancel.is_set():
+                        return
                     if choice == "":
                         self._log("Detect cancelled by user.")
                         self._set_busy(False, "")
@@ -331,7 +430,7 @@ class App(ctk.CTk):
                         self._set_busy(False, "")
                         return
                     # If user asked to remember, store for next time
-                    if selected_port_holder.get("remember"):
+                    if remember:
                         AppState.set_preferred_port(choice)
                     else:
                         # If previously remembered, clear it
@@ -347,26 +446,31 @@ class App(ctk.CTk):
                     self._set_busy(False, "")
                     return
 
+            if cancel.is_set():
+                return
             self._connected_port = port
             model = self.settings.fetch_device_model(close_after_fetch=True)
+            if cancel.is_set():
+                return
             self._orig_model = model
-            ident = f"{model.UserInfo.hwModel} | FW {model.MetaData.firmwareVersion}"
-            self._log(f"""Successfully Connected to: {(long_name:=getattr(model.UserInfo,'longName',None))}\n
-                port= {getattr(model.MetaData,'port',None)}
-                device model= {getattr(model.UserInfo,'hwModel',None)}
-                long name= {long_name}
-                device reboots= {getattr(model.MyInfo,'rebootCount',None)}
-                firmware= {getattr(model.MetaData,'firmwareVersion',None)}\n
-            """)
-            
+            user, meta = model.UserInfo, model.MetaData
+            long_name = getattr(user, "longName", None)
+            self._log(lambda: "\n    ".join((
+                f"Successfully Connected to: {long_name}",
+                f"port= {getattr(meta, 'port', None)}",
+                f"device model= {getattr(user, 'hwModel', None)}",
+                f"long name= {long_name}",
+                f"device reboots= {getattr(model.MyInfo, 'rebootCount', None)}",
+                f"firmware= {getattr(meta, 'firmwareVersion', None)}",
+            )))
+
             def _apply_ui():
                 self._apply_model_to_all_panels(model)
                 try:
                     self._update_device_info(model)
                 except Exception:
                     pass
-                self.btn_apply.configure(state="normal")
-                self.btn_disconnect.configure(state="normal")
+                self._set_state(self.btn_disconnect, "normal")
                 self._set_busy(False, "Connected")
 
             self.after(0, _apply_ui)
@@ -380,7 +484,7 @@ class App(ctk.CTk):
             self._log("Fix validation errors before applying.")
             return
         self._set_busy(True, "Applying…")
-        threading.Thread(target=self._apply_worker, daemon=True).start()
+        self._submit_io(self._apply_worker)
 
     def _on_disconnect_clicked(self):
         """
@@ -390,7 +494,7 @@ class App(ctk.CTk):
         """
         # Disable button to avoid re-entry
         try:
-            self.btn_disconnect.configure(state="disabled")
+            self._set_state(self.btn_disconnect, "disabled")
         except Exception:
             pass
 
@@ -402,104 +506,72 @@ class App(ctk.CTk):
                 pass
             self._refresh_job = None
 
-        # Stop any in-flight apply worker
-        apply_cancel = getattr(self, "_apply_cancel", None)
-        if apply_cancel:
-            try: apply_cancel.set()
-            except Exception: pass
-        t = getattr(self, "_apply_thread", None)
-        if t and getattr(t, "is_alive", lambda: False)():
-            try: t.join(timeout=2.0)
-            except Exception: pass
-
-        # Close controllers / iface holders if present
-        def _close_obj(obj):
-            if not obj:
-                return
-            for meth in ("disconnect", "close", "_detach_for_cli", "release", "shutdown"):
-                if hasattr(obj, meth):
-                    try:
-                        getattr(obj, meth)()
-                    except Exception:
-                        pass
-            for attr in ("_iface", "iface", "serial", "ser"):
-                h = getattr(obj, attr, None)
-                if h and hasattr(h, "close"):
-                    try:
-                        h.close()
-                    except Exception:
-                        pass
+        # Cancel the device job: a queued one never starts; a running one stops at its next
+        # checkpoint, and the rest of the disconnect runs once it has finished.
+        fut, self._io_future = self._io_future, None
+        if self._io_cancel is not None:
+            self._io_cancel.set()
+        if fut is not None and not fut.cancel() and not fut.done():
+            self._set_busy(True, "Disconnecting…")
+            fut.add_done_callback(lambda f: self.after(0, self._finish_disconnect))
+            return
+        self._finish_disconnect()
 
-        # Likely holders
-        for attr in ("dc", "device_controller", "controller", "writer", "reader", "_iface"):
-            _close_obj(getattr(self, attr, None))
+    def _finish_disconnect(self):
+        """Second half of _on_disconnect_clicked; runs once no device job is in flight."""
+        # Close registered device resources, in registration order
+        for closer in self._resource_closers:
+            try:
+                closer()
+            except Exception:
+                log.exception("Closer %r failed during disconnect", closer)
+        for obj in self._closeables:
+            try:
+                obj.close()
+            except Exception:
+                pass
+        self._closeables.clear()
 
-        # Reset connection flags/state
+        # Reset connection state
         self._connected_port = None
-        for attr in ("_orig_model", "_current_model", "_edited_model"):
-            setattr(self, attr, None)
-        if hasattr(self, "_device_connected"):
-            self._device_connected = False
-
-        # CLEAR all panel UIs explicitly via panel.clear_ui() if available
-        try:
-            for p in getattr(self, "panels", {}).values():
-                if hasattr(p, "clear_ui"):
-                    try:
-                        p.clear_ui()
-                    except Exception:
-                        pass
-        except Exception:
-            pass
-
-        # Also apply a blank model to ensure a consistent cleared state
-        try:
-            blank = self._make_blank_model()
-            self._apply_model_to_all_panels(blank)
-        except Exception:
-            pass
-
-        # UI controls: disable Apply (no model loaded), enable Connect, update status
-        try:
-            self.btn_apply.configure(state="disabled")
-        except Exception:
-            pass
-        try:
-            self.btn_connect.configure(state="normal")
-        except Exception:
-            pass
-
-        try:
-            self._set_busy(False, "Disconnected")
-        except Exception:
-            pass
-
-        # Re-enable Disconnect for idempotence
-        try:
-            self.btn_disconnect.configure(state="normal")
-        except Exception:
-            pass
-
-        try:
-            self._log("Disconnected; serial interface closed, state reset, UI cleared.")
-            self.btn_apply.configure(state="disabled")
-            self.btn_disconnect.configure(state="disabled")
-            # Clear device info bar
-            if hasattr(self, "device_info_lbl"):
-                self.device_info_lbl.configure(text="")
-        except Exception:
-            pass
+        self._orig_model = None
+
+        # UI resets, run in order; each is isolated so one failure never skips the rest.
+        # clear_ui may drop/recreate bound rows, so the preset section index is invalidated after it.
+        # _set_busy(False) re-enables Detect and keeps Apply disabled since _orig_model is None.
+        reset_actions = (
+            *(p.clear_ui for p in self.panels.values() if hasattr(p, "clear_ui")),
+            self._invalidate_section_index,
+            lambda: self._apply_model_to_all_panels(self._make_blank_model()),
+            lambda: self._set_busy(False, "Disconnected"),
+            lambda: self._set_state(self.btn_disconnect, "disabled"),
+            lambda: self._log("Disconnected; serial interface closed, state reset, UI cleared."),
+            lambda: self._set_device_info(""),
+        )
+        for action in reset_actions:
+            try:
+                action()
+            except Exception:
+                pass
 
-    def _apply_worker(self):
+    def _apply_worker(self, cancel: threading.Event):
         self._log("\nupdating device...")
         self._log("...this may take a few moments...\n")
+        dc: Optional[DeviceController] = None
         try:
             if not self._connected_port or not self._orig_model:
                 raise ValueError("Cannot apply, no device model loaded.")
 
             edited_model = self._build_edited_model(self._orig_model)
+            if cancel.is_set():
+                return
             dc = DeviceController(port=self._connected_port)
+            self._closeables.append(dc)
             summary = dc.apply_from_models(self._orig_model, edited_model)
+            if cancel.is_set():
+                # Disconnected mid-apply: the report is still logged, but the UI was already cleared
+                self._log(dumps_pretty(self._summarize_apply_report(summary)))
+                return
             model = summary.pop("post_snapshot", None)
             # Ensure we always have a model to re-populate UI, even on no-change or partial reports
             if model is None:
@@ -507,18 +579,16 @@ class App(ctk.CTk):
                     model = dc.reader.snapshot(force_refresh=False)
                 except Exception:
                     model = dc.reader.snapshot(force_refresh=True)
-            # self._log(json.dumps(summary, indent=2, default=str))
-            self._log(json.dumps(self._summarize_apply_report(summary), indent=2, default=str))
+            # Repopulate panels first so the UI updates before the (slower) report serialization.
+            # The panels currently show edited_model; only sections the device reports differently need a refresh
+            self._orig_model = model
+            self.after(0, lambda: self._apply_model_to_changed_panels(model, edited_model))
+            self._log(dumps_pretty(self._summarize_apply_report(summary)))
 
-            
             if summary.get("errors"):
                 self._log(f"Apply finished with errors: {summary['errors']}")
                 self._set_busy(False, "Apply finished with errors")
-                self._orig_model = model
-                self.after(0, lambda: self._apply_model_to_all_panels(model))
             else:
-                self._orig_model = model
-                self.after(0, lambda: self._apply_model_to_all_panels(model))
                 self.after(0, lambda: self._update_device_info(model))
                 # If nothing changed, avoid extra refresh work
                 if str(summary.get("status") or "").lower() == "no_change":
@@ -532,11 +602,38 @@ class App(ctk.CTk):
             log.exception("Apply worker failed")
             self._set_busy(False, f"Apply failed: {e}")
             self._log(f"Apply failed: {e}")
+        finally:
+            if dc is not None:
+                try:
+                    self._closeables.remove(dc)
+                except ValueError:
+                    pass
+                try:
+                    dc.close()
+                except Exception:
+                    pass
 
     def _apply_model_to_all_panels(self, model: DeviceModel):
         """Iterates through all registered panels and applies the model."""
-        for panel in self.panels.values():
-            panel.apply_model(model)
+        self._build_remaining_panels()
+        for _, apply_fn in self._panel_appliers:
+            apply_fn(model)
+
+    def _apply_model_to_changed_panels(self, model: DeviceModel, shown: Optional[DeviceModel]):
+        """
+        Apply model only to panels whose model_sections differ from `shown` (the model the
+        UI currently reflects). Falls back to a full apply when there is nothing to diff against.
+        """
+        if shown is None:
+            self._apply_model_to_all_panels(model)
+            return
+        # Nothing changed at all (common on refresh retries): skip the per-section diff entirely
+        if model is shown or model == shown:
+            return
+        self._build_remaining_panels()
+        for secs, apply_fn in self._panel_appliers:
+            if not secs or any(getattr(model, s, None) != getattr(shown, s, None) for s in secs):
+                apply_fn(model)
 
 
     # ---------------- Channel Refresh After Apply ----------------
@@ -546,8 +643,8 @@ class App(ctk.CTk):
         Runs on the Tk main loop via after(); non-blocking.
         """
         try:
-            self.status_lbl.configure(text="Refreshing channels…")
-            self.btn_apply.configure(state="disabled")
+            self._set_status("Refreshing channels…")
+            self._set_state(self.btn_apply, "disabled")
         except Exception:
             pass
 
@@ -556,41 +653,48 @@ class App(ctk.CTk):
         except Exception:
             pass
 
-        state = {"attempt": 0, "max": max_attempts}
+        # One controller (one serial open) is reused across all attempts and closed once at the end
+        state = {"attempt": 0, "max": max_attempts, "dc": None}
 
-        def _tick():
-            try:
-                if not self._connected_port:
-                    return
-                from controllers.device_controller import DeviceController
-                dc = DeviceController(port=self._connected_port)
-                m = dc.snapshot()
-                has_channels = bool(getattr(m, "MeshChannels", None))
+        def _close_dc():
+            dc, state["dc"] = state["dc"], None
+            if dc is not None:
                 try:
                     dc.close()
                 except Exception:
                     pass
-                if has_channels:
-                    self._orig_model = m
-                    self._apply_model_to_all_panels(m)
+
+        def _tick():
+            try:
+                if not self._connected_port:
+                    _close_dc()
+                    return
+                if state["dc"] is None:
+                    state["dc"] = DeviceController(port=self._connected_port)
+                m = state["dc"].snapshot()
+                if getattr(m, "MeshChannels", None):
+                    _close_dc()
+                    shown, self._orig_model = self._orig_model, m
+                    self._apply_model_to_changed_panels(m, shown)
                     self._set_busy(False, "Applied successfully")
                     try:
-                        self.btn_apply.configure(state="normal")
+                        self._set_state(self.btn_apply, "normal")
                     except Exception:
                         pass
                     return
             except Exception:
-                # swallow and retry
+                # swallow and retry (the controller is opened again next tick if opening failed)
                 pass
 
             state["attempt"] += 1
             if state["attempt"] < state["max"]:
                 self.after(interval_ms, _tick)
             else:
+                _close_dc()
                 # Give up enabling apply anyway to avoid trapping the user
                 self._set_busy(False, "Applied (channels pending)")
                 try:
-                    self.btn_apply.configure(state="normal")
+                    self._set_state(self.btn_apply, "normal")
                 except Exception:
                     pass
 
@@ -599,11 +703,13 @@ class App(ctk.CTk):
 
     def _build_edited_model(self, base: DeviceModel) -> DeviceModel:
         """Builds an edited DeviceModel by collecting overlays from all panels."""
-        m = base.model_copy(deep=True)
+        # Shallow copy: each panel replaces the section(s) it edits with its own copy,
+        # so untouched sections are shared with the original snapshot.
+        m = base.model_copy()
 
         for panel in self.panels.values():
             # Channels panel has a special method, others use the standard overlay
-            if isinstance(panel, ChannelsPanel):
+            if hasattr(panel, "collect_meshchannels"):
                 m.MeshChannels = panel.collect_meshchannels()
             else:
                 m = panel.collect_model_overlay(m)
@@ -613,25 +719,35 @@ class App(ctk.CTk):
 
     def _update_preset_button_states(self):
         selected_preset = self.preset_menu.get()
-        is_valid = selected_preset and selected_preset != "Load Preset..."
-        self.btn_rename_preset.configure(state="normal" if is_valid else "disabled")
-        self.btn_delete_preset.configure(state="normal" if is_valid else "disabled")
+        is_valid = bool(selected_preset and selected_preset != "Load Preset...")
+        if is_valid == self._preset_buttons_enabled:
+            return
+        self._preset_buttons_enabled = is_valid
+        state = "normal" if is_valid else "disabled"
+        self._set_state(self.btn_rename_preset, state)
+        self._set_state(self.btn_delete_preset, state)
 
     def _refresh_preset_menu(self, *, select: str | None = None):
         names = self.presets.get_preset_names()
-        values = ["Load Preset..."] + names
-        self.preset_menu.configure(values=values)
+        values = ("Load Preset...", *names)
+        # Reconfiguring the option menu tears down and rebuilds its Tk menu; skip when unchanged
+        if values != self._preset_values_cache:
+            self._preset_values_cache = values
+            self.preset_menu.configure(values=list(values))
         self.preset_menu.set(select if select in values else "Load Preset...")
         self._update_preset_button_states()
 
 
     def _serialize_app_settings_for_preset(self) -> dict:
         """Gathers settings from all panels to be saved in a preset."""
-        data = {}
+        self._build_remaining_panels()
+        data: Dict[str, Dict[str, Any]] = {}
         for panel in self.panels.values():
-            bindings = panel.preset_bindings()
-            for section, controls in bindings.items():
-                data[section] = {label: var.get() for label, var in controls.items()}
+            for section, label, var in panel.flat_bindings():
+                fields = data.get(section)
+                if fields is None:
+                    fields = data[section] = {}
+                fields[label] = var.get()
         return data
 
 
@@ -643,16 +759,10 @@ class App(ctk.CTk):
         (e.g., ChannelsPanel for 'Channel N'), allowing creation of new rows.
         """
         preset = preset or {}
+        self._build_remaining_panels()
 
-        # Build index from panels' current bindings
-        section_to_panel: Dict[str, BasePanel] = {}
-        for panel in self.panels.values():
-            if hasattr(panel, "preset_bindings"):
-                try:
-                    for sec in panel.preset_bindings().keys():
-                        section_to_panel[sec] = panel
-                except Exception:
-                    pass
+        # Index of panels' current bindings (rebuilt only after a panel invalidates it)
+        section_to_panel = self._get_section_index()
 
         # If the preset contains any channel sections, clear Channels UI first
         try:
@@ -664,7 +774,8 @@ class App(ctk.CTk):
         except Exception:
             pass
 
-        # Dispatch each section
+        # Dispatch each section; problems are collected and logged once at the end
+        warnings: List[str] = []
         for raw_section, fields in preset.items():
             section = str(raw_section).strip()
             dispatched = False
@@ -673,24 +784,27 @@ class App(ctk.CTk):
             panel = section_to_panel.get(section)
             if panel and hasattr(panel, "preset_apply"):
                 try:
-                    panel.preset_apply({section: fields})
+                    panel.preset_apply_section(section, fields)
                     dispatched = True
                 except Exception as e:
-                    self._log(f"Warning: preset section '{section}' apply failed on {panel.section_title}: {e}")
+                    warnings.append(f"preset section '{section}' apply failed on {panel.section_title}: {e}")
 
             if not dispatched:
                 # Fallback: ask panels if they support this section even if it isn't in bindings yet
-                for p in self.panels.values():
-                    if hasattr(p, "supports_preset_section") and p.supports_preset_section(section):
+                for p in self._supports_section_panels:
+                    if p.supports_preset_section(section):
                         try:
-                            p.preset_apply({section: fields})
+                            p.preset_apply_section(section, fields)
                             dispatched = True
                             break
                         except Exception as e:
-                            self._log(f"Warning: preset section '{section}' apply failed on {p.section_title}: {e}")
+                            warnings.append(f"preset section '{section}' apply failed on {p.section_title}: {e}")
 
             if not dispatched:
-                self._log(f"Warning: No panel found to handle preset section '{section}'")
+                warnings.append(f"No panel found to handle preset section '{section}'")
+
+        if warnings:
+            self._log("Preset apply warnings:\n  " + "\n  ".join(warnings))
 
     def _on_load_preset(self, preset_name: str):
         self._update_preset_button_states()
@@ -755,27 +869,83 @@ class App(ctk.CTk):
 
     # ---------------- Misc & Logging ----------------
 
-    def _poll_logs(self):
-        try:
-            while True: self._log(self.log_q.get_nowait())
-        except queue.Empty:
-            pass
-        self.after(200, self._poll_logs)
+    def _drain_logs(self):
+        """
+        Move up to LOG_DRAIN_BATCH queued records into the log box in one insert. While lines
+        keep arriving, come back shortly for more: worker threads never wake the Tk thread
+        themselves, so this re-poll (and the 1s watchdog when idle) is what picks them up.
+        """
+        lines = self.log_buf.drain(LOG_DRAIN_BATCH)
+        if lines:
+            self._append_lines(lines)
+            if not self._drain_pending:
+                self._drain_pending = True
+                self.after(50, self._drain_backlog)
+
+    def _drain_backlog(self):
+        self._drain_pending = False
+        self._drain_logs()
+
+    def _log_watchdog(self):
+        """Idle poll: drain lines pushed from worker threads (and any lost <<LogArrived>> wake)."""
+        self._drain_logs()
+        self.after(1000, self._log_watchdog)
+
+    def _log(self, s: str | Callable[[], str]):
+        """
+        Append a line to the log box. Safe to call from worker threads: off the Tk thread the
+        line goes through log_buf and is inserted by the next batched drain.
+        s may be a zero-arg callable; it is only called when the line is actually inserted
+        (never if it is trimmed while the log box is hidden).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            self.log_buf.push(s if callable(s) else str(s))
+            return
+        # Flush everything already buffered first so the log stays in order
+        self._append_lines(self.log_buf.drain() + [s])
 
-    def _log(self, s: str):
+    def _append_lines(self, lines: List[str]):
+        """
+        Insert a batch of lines with a single normal/insert/see/disabled cycle.
+        Only auto-scrolls when the view was already at the bottom, so scrolling back
+        through history doesn't force a scroll (and re-layout) on every batch.
+        """
         try:
+            # While the log box is not on screen (e.g. window minimized) just hold the lines;
+            # _flush_hidden_logs inserts them in one batch when it is mapped again
+            if not self.log_box.winfo_viewable():
+                self._hidden_logs.extend(lines)
+                return
+            if self._hidden_logs:
+                lines = [*self._hidden_logs, *lines]
+                self._hidden_logs.clear()
+            text = "\n".join(str(s() if callable(s) else s).strip() for s in lines) + "\n"
+            follow = self.log_box.yview()[1] >= 0.999
             self.log_box.configure(state="normal")
-            self.log_box.insert("end", str(s).strip() + "\n")
-            self.log_box.see("end")
+            self.log_box.insert("end", text)
+            self._log_lines += text.count("\n")
+            if self._log_lines > MAX_LOG_LINES:
+                # Trim from the top once per batch, then resync the count from the widget
+                excess = self._log_lines - MAX_LOG_LINES
+                self.log_box.delete("1.0", f"{excess + 1}.0")
+                self._log_lines = int(self.log_box.index("end-1c").split(".")[0]) - 1
+            if follow:
+                self.log_box.see("end")
             self.log_box.configure(state="disabled")
         except Exception:
             pass
 
+    def _flush_hidden_logs(self):
+        if self._hidden_logs:
+            self._append_lines([])
+
     def _on_clear_log(self):
+        self._hidden_logs.clear()
         try:
             self.log_box.configure(state="normal")
             self.log_box.delete("1.0", "end")
             self.log_box.configure(state="disabled")
+            self._log_lines = 0
         except Exception:
             pass
 
@@ -783,26 +953,46 @@ class App(ctk.CTk):
         """Show concise device info on the info bar (right side)."""
         try:
             if not model:
-                self.device_info_lbl.configure(text="")
+                self._set_device_info("")
                 return
-            port = getattr(getattr(model, "MetaData", None), "port", None) or ""
-            hw = getattr(getattr(model, "UserInfo", None), "hwModel", None) or getattr(getattr(model, "MetaData", None), "hwModel", None) or ""
-            fw = getattr(getattr(model, "MetaData", None), "firmwareVersion", None) or ""
+            md = getattr(model, "MetaData", None)
+            port = getattr(md, "port", None) or ""
+            hw = getattr(getattr(model, "UserInfo", None), "hwModel", None) or getattr(md, "hwModel", None) or ""
+            fw = getattr(md, "firmwareVersion", None) or ""
             parts = []
             if port: parts.append(f"Port: {port}")
             if hw: parts.append(f"Model: {hw}")
             if fw: parts.append(f"FW: {fw}")
-            self.device_info_lbl.configure(text="  |  ".join(parts))
+            self._set_device_info("  |  ".join(parts))
         except Exception:
             try:
-                self.device_info_lbl.configure(text="")
+                self._set_device_info("")
             except Exception:
                 pass
 
+    def _set_device_info(self, text: str):
+        """Update the info bar label, skipping the configure when the text is unchanged."""
+        if text != self._device_info_text:
+            self.device_info_lbl.configure(text=text)
+            self._device_info_text = text
+
+    def _set_state(self, btn, state: str):
+        """Configure a button's state only when it differs from the last state we set."""
+        key = id(btn)
+        if self._btn_state_cache.get(key) != state:
+            btn.configure(state=state)
+            self._btn_state_cache[key] = state
+
+    def _set_status(self, text: str):
+        """Update the toolbar status label, skipping the configure when the text is unchanged."""
+        if text != self._status_text:
+            self.status_lbl.configure(text=text)
+            self._status_text = text
+
     def _set_busy(self, busy: bool, status: str = ""):
-        self.status_lbl.configure(text=status)
-        self.btn_detect.configure(state="disabled" if busy else "normal")
-        self.btn_apply.configure(state=("disabled" if busy else "normal") if self._orig_model else "disabled")
+        self._set_status(status)
+        self._set_state(self.btn_detect, "disabled" if busy else "normal")
+        self._set_state(self.btn_apply, ("disabled" if busy else "normal") if self._orig_model else "disabled")
         # Bottom progress bar visibility
         try:
             if busy:
@@ -824,43 +1014,20 @@ class App(ctk.CTk):
 
     def _make_blank_model(self) -> DeviceModel:
         """
-        Construct a minimal 'blank' DeviceModel that causes panels to clear their fields.
-        Uses pydantic's validation if available; falls back to a deep-copied shell.
+        Return a minimal 'blank' DeviceModel that causes panels to clear their fields.
+        The validated shell is built once per process and shared (panels only read it);
+        copy it before mutating. Falls back to a deep-copied, blanked last model.
         """
         try:
-            # Pydantic v2 style; fills optionals with defaults/None
-            return DeviceModel.model_validate({
-                "Device": {},
-                "UserInfo": {},
-                "Lora": {},
-                "Power": {},
-                "Position": {},
-                "Display": {},
-                "BlueTooth": {},
-                "Network": {},
-                "ModuleConfig": {},
-                "MeshChannels": [],
-                "MetaData": {},
-                "MyInfo": {},
-            })
+            return _blank_model()
         except Exception:
-            # Fallback: deep copy whatever we last had and blank the sections
+            # Fallback: copy whatever we last had and blank every section
+            # (all fields are replaced, so a shallow copy is enough)
             try:
                 if getattr(self, "_orig_model", None) is not None:
-                    blank = self._orig_model.model_copy(deep=True)
-                    for sec in ("Device","UserInfo","Lora","Power","Position","Display",
-                                "BlueTooth","Network","ModuleConfig","MetaData","MyInfo"):
-                        if hasattr(blank, sec):
-                            try:
-                                # Replace dict-like/objects with empty instance, else set None
-                                cur = getattr(blank, sec)
-                                if isinstance(cur, (dict, list, set, tuple)):
-                                    setattr(blank, sec, type(cur)())
-                                else:
-                                    setattr(blank, sec, None)
-                            except Exception:
-                                setattr(blank, sec, None)
-                    setattr(blank, "MeshChannels", [])
+                    blank = self._orig_model.model_copy()
+                    for sec, factory in _BLANK_SECTION_FACTORIES.items():
+                        setattr(blank, sec, factory() if factory else None)
                     return blank
             except Exception:
                 pass
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
+import os
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+from .json_codec import dumps_pretty, loads as json_loads
 from .preset_controller import PresetController
 
 log = logging.getLogger(__name__)
@@ -19,51 +20,92 @@ class AppState:
 
     FILENAME = "app_state.json"
 
+    # In-memory copy of the state file, valid while the file's mtime matches
+    # _mtime_ns; kept in step by save(), so repeated gets don't re-read the file
+    _cache: Optional[Dict[str, Any]] = None
+    _mtime_ns: int = 0
+    _path: Optional[Path] = None
+
     @classmethod
     def _state_path(cls) -> Optional[Path]:
-        pc = PresetController()
-        if pc.preset_dir is None:
-            return None
-        return pc.preset_dir / cls.FILENAME
+        # Resolved once; constructing a PresetController touches the filesystem
+        if cls._path is None:
+            pc = PresetController()
+            if pc.preset_dir is None:
+                return None
+            cls._path = pc.preset_dir / cls.FILENAME
+        return cls._path
 
     @classmethod
-    def load(cls) -> Dict[str, Any]:
+    def _read(cls) -> Dict[str, Any]:
+        """Return the cached state dict, re-reading only if the file changed. Callers must not mutate it."""
         p = cls._state_path()
-        if p is None or not p.exists():
+        if p is None:
             return {}
         try:
-            return json.loads(p.read_text(encoding="utf-8")) or {}
+            mtime_ns = p.stat().st_mtime_ns
+        except OSError:
+            cls._cache = None
+            return {}
+        if cls._cache is not None and mtime_ns == cls._mtime_ns:
+            return cls._cache
+        try:
+            cls._cache = json_loads(p.read_bytes()) or {}
+            cls._mtime_ns = mtime_ns
         except Exception as e:
             log.warning("[app-state] failed to read %s: %s", p, e)
+            cls._cache = None
             return {}
+        return cls._cache
+
+    @classmethod
+    def load(cls) -> Dict[str, Any]:
+        return dict(cls._read())
 
     @classmethod
     def save(cls, data: Dict[str, Any]) -> bool:
+        """Write atomically (temp file + os.replace) so a crash never leaves a truncated file."""
         p = cls._state_path()
         if p is None:
             return False
+        data = dict(data or {})
+        tmp = p.with_suffix(".json.tmp")
         try:
-            p.write_text(json.dumps(data or {}, indent=2), encoding="utf-8")
-            return True
+            tmp.write_text(dumps_pretty(data), encoding="utf-8")
+            os.replace(tmp, p)
         except Exception as e:
             log.warning("[app-state] failed to write %s: %s", p, e)
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
             return False
+        try:
+            cls._mtime_ns = p.stat().st_mtime_ns
+            cls._cache = data
+        except OSError:
+            cls._cache = None
+        return True
 
     # Convenience helpers
     @classmethod
     def get_preferred_port(cls) -> Optional[str]:
-        return (cls.load() or {}).get("preferred_port") or None
+        return cls._read().get("preferred_port") or None
 
     @classmethod
     def set_preferred_port(cls, port: str) -> bool:
-        d = cls.load() or {}
+        cur = cls._read()
+        if cur.get("preferred_port") == port:
+            return True
+        d = dict(cur)
         d["preferred_port"] = port
         return cls.save(d)
 
     @classmethod
     def clear_preferred_port(cls) -> bool:
-        d = cls.load() or {}
-        if "preferred_port" in d:
+        cur = cls._read()
+        if "preferred_port" in cur:
+            d = dict(cur)
             d.pop("preferred_port", None)
             return cls.save(d)
         return True
@@ -8,6 +8,7 @@ import shlex
 import shutil
 import logging
 import platform
+import threading
 import subprocess
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
@@ -21,6 +22,109 @@ def _now() -> float:
     return time.monotonic()
 
 
+# Poll delays for readiness waits: start short so a quick device is picked up
+# right away, then settle at the old fixed 200ms interval
+_BACKOFF_DELAYS = (0.02, 0.05, 0.1)
+_BACKOFF_CAP = 0.2
+
+
+def _backoff(timeout_s: float):
+    """
+    Yields once per poll attempt until timeout_s has elapsed, sleeping between
+    attempts with exponential backoff (never past the deadline).
+    """
+    deadline = _now() + timeout_s
+    attempt = 0
+    while True:
+        yield attempt
+        remaining = deadline - _now()
+        if remaining <= 0:
+            return
+        delay = _BACKOFF_DELAYS[attempt] if attempt < len(_BACKOFF_DELAYS) else _BACKOFF_CAP
+        time.sleep(min(delay, remaining))
+        attempt += 1
+
+
+def _hidden_console_options() -> tuple[int, Any]:
+    """creationflags/startupinfo that keep the CLI from flashing a console window on Windows."""
+    if os.name != "nt":
+        return 0, None
+    creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    try:
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = 0  # SW_HIDE
+    except Exception:
+        startupinfo = None
+    return creationflags, startupinfo
+
+
+# Built once; subprocess copies startupinfo per call, so sharing it is safe
+_CREATIONFLAGS, _STARTUPINFO = _hidden_console_options()
+
+
+# Resolved CLI path per MESHTASTIC_CLI value; only successful lookups are cached,
+# so a CLI installed while the app is running is still picked up on the next connect
+_CLI_PATH_CACHE: Dict[Optional[str], str] = {}
+
+
+def _find_meshtastic_cli(env: Optional[str]) -> Optional[str]:
+    """
+    Finds the 'meshtastic' CLI executable. Resolution order:
+    1) env (the MESHTASTIC_CLI env var value)
+    2) If frozen (PyInstaller), look next to the executable
+    3) Dev-time: common dist paths relative to repo root
+    4) PATH (meshtastic / meshtastic.exe)
+    Returns None when nothing is found.
+    """
+    # 1) Explicit override
+    if env:
+        return env
+
+    # 2) Packaged: next to the PyInstaller EXE
+    try:
+        if getattr(sys, "frozen", False):
+            app_dir = os.path.dirname(sys.executable)
+            candidates = [
+                os.path.join(app_dir, "meshtastic.exe"),
+                os.path.join(app_dir, "meshtastic"),
+            ]
+            for p in candidates:
+                if os.path.isfile(p):
+                    return p
+    except Exception:
+        pass
+
+    # 3) Dev-time: try repo-local dist locations
+    try:
+        here = os.path.dirname(os.path.abspath(__file__))
+        # controllers/_device_common.py -> project root
+        root = os.path.abspath(os.path.join(here, os.pardir, os.pardir))
+        dev_candidates = [
+            os.path.join(root, "dist", "release", "meshtastic.exe"),
+            os.path.join(root, "dist", "release", "meshtastic"),
+            os.path.join(root, "dist", "meshtastic.exe"),
+            os.path.join(root, "dist", "meshtastic"),
+        ]
+        for p in dev_candidates:
+            if os.path.isfile(p):
+                return p
+    except Exception:
+        pass
+
+    # 4) PATH
+    cand = shutil.which("meshtastic")
+    if cand:
+        return cand
+    if platform.system().lower().startswith("win"):
+        cand = shutil.which("meshtastic.exe")
+        if cand:
+            return cand
+
+    # Fallback: let subprocess try/err with a clear message
+    return None
+
+
 @dataclass
 class CliResult:
     cmd: List[str]
@@ -35,11 +139,18 @@ class DeviceBase:
     Shared base: manages SerialInterface lifecycle and common helpers.
     """
 
-    def __init__(self, port: Optional[str] = None, iface: Optional[SerialInterface] = None):
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        iface: Optional[SerialInterface] = None,
+        config_ready: Optional[threading.Event] = None,
+    ):
         if not port and not iface:
             raise ValueError("Device requires either a serial 'port' or an existing 'iface'")
         self._iface = iface or SerialInterface(devPath=port)
         self._owns_iface = iface is None
+        # False between _detach_for_cli() and a successful _reconnect_after_cli()
+        self._attached = True
 
         # Port path for CLI routing (avoid auto-detect flakiness)
         self._port_path = getattr(self._iface, "port", None) or getattr(self._iface, "devPath", None)
@@ -48,74 +159,56 @@ class DeviceBase:
         self._cli_path = self._resolve_cli_path()
         log.debug("Resolved meshtastic CLI: %s", self._cli_path)
 
-        # Initial warm-up (non-fatal if it times out)
+        # CLI prefix shared by every _exec_cli call (executable + --port routing)
+        base_cmd = [self._cli_path]
+        if self._port_path:
+            base_cmd += ["--port", str(self._port_path)]
+        self._base_cmd: tuple[str, ...] = tuple(base_cmd)
+
+        # Initial warm-up (non-fatal if it times out), off the caller's thread;
+        # snapshot() waits on _config_ready instead of blocking construction.
+        # Only the instance that opened the iface warms it up; instances sharing an iface reuse
+        # the owner's Event (or, without one, treat the caller's iface as already configured).
+        if self._owns_iface:
+            self._config_ready = threading.Event()
+            threading.Thread(
+                target=self._warm_up, args=(self._iface,), name="device-warmup", daemon=True
+            ).start()
+        elif config_ready is not None:
+            self._config_ready = config_ready
+        else:
+            self._config_ready = threading.Event()
+            self._config_ready.set()
+
+    def _warm_up(self, iface: SerialInterface) -> None:
         try:
-            self._iface.localNode.waitForConfig()
+            iface.localNode.waitForConfig()
         except Exception:
             pass
+        finally:
+            self._config_ready.set()
 
     # ------------- CLI plumbing -------------
 
     def _resolve_cli_path(self) -> str:
-        """
-        Finds the 'meshtastic' CLI executable. Resolution order:
-        1) MESHTASTIC_CLI env var
-        2) If frozen (PyInstaller), look next to the executable
-        3) Dev-time: common dist paths relative to repo root
-        4) PATH (meshtastic / meshtastic.exe)
-        """
-        # 1) Explicit override
+        """Cached lookup of the 'meshtastic' CLI executable (see _find_meshtastic_cli)."""
         env = os.getenv("MESHTASTIC_CLI")
-        if env:
-            return env
-
-        # 2) Packaged: next to the PyInstaller EXE
-        try:
-            if getattr(sys, "frozen", False):
-                app_dir = os.path.dirname(sys.executable)
-                candidates = [
-                    os.path.join(app_dir, "meshtastic.exe"),
-                    os.path.join(app_dir, "meshtastic"),
-                ]
-                for p in candidates:
-                    if os.path.isfile(p):
-                        return p
-        except Exception:
-            pass
-
-        # 3) Dev-time: try repo-local dist locations
-        try:
-            here = os.path.dirname(os.path.abspath(__file__))
-            # controllers/_device_common.py -> project root
-            root = os.path.abspath(os.path.join(here, os.pardir, os.pardir))
-            dev_candidates = [
-                os.path.join(root, "dist", "release", "meshtastic.exe"),
-                os.path.join(root, "dist", "release", "meshtastic"),
-                os.path.join(root, "dist", "meshtastic.exe"),
-                os.path.join(root, "dist", "meshtastic"),
-            ]
-            for p in dev_candidates:
-                if os.path.isfile(p):
-                    return p
-        except Exception:
-            pass
-
-        # 4) PATH
-        cand = shutil.which("meshtastic")
-        if cand:
-            return cand
-        if platform.system().lower().startswith("win"):
-            cand = shutil.which("meshtastic.exe")
-            if cand:
-                return cand
-
-        # Fallback: let subprocess try/err with a clear message
-        return "meshtastic"
+        path = _CLI_PATH_CACHE.get(env)
+        if path is None:
+            path = _find_meshtastic_cli(env)
+            if path is None:
+                return "meshtastic"
+            _CLI_PATH_CACHE[env] = path
+        return path
 
     def _detach_for_cli(self) -> None:
         """
         Close the SerialInterface before invoking CLI to avoid port contention.
+        No-op if it is already detached (e.g. the reconnect after the CLI failed).
         """
+        if not self._attached:
+            return
+        self._attached = False
         try:
             if self._iface is not None:
                 self._iface.close()
@@ -125,14 +218,23 @@ class DeviceBase:
     def _reconnect_after_cli(self, wait_ready_s: float = 12.0) -> None:
         """
         Recreate the SerialInterface and wait briefly for config to be ready.
+        The reopen is retried with backoff (e.g. while the port re-enumerates after a
+        reboot). Reopen and config wait share one wait_ready_s budget; the config wait always
+        gets at least one attempt.
         """
-        try:
-            self._iface = SerialInterface(devPath=self._port_path)  # re-open
-        except Exception as e:
-            raise RuntimeError(f"Failed to reopen serial interface on {self._port_path}: {e}") from e
+        deadline = _now() + wait_ready_s
+        last_err: Optional[Exception] = None
+        for _ in _backoff(wait_ready_s):
+            try:
+                self._iface = SerialInterface(devPath=self._port_path)  # re-open
+                self._attached = True
+                break
+            except Exception as e:
+                last_err = e
+        else:
+            raise RuntimeError(f"Failed to reopen serial interface on {self._port_path}: {last_err}") from last_err
 
-        start = _now()
-        while _now() - start < wait_ready_s:
+        for _ in _backoff(max(0.0, deadline - _now())):
             try:
                 self._iface.localNode.waitForConfig()
                 # best-effort: load channels (non-fatal)
@@ -142,7 +244,7 @@ class DeviceBase:
                     pass
                 return
             except Exception:
-                time.sleep(0.2)
+                continue
         # If we get here, still continue; caller can decide to mark a warning
 
     def _exec_cli(
@@ -159,31 +261,15 @@ class DeviceBase:
         - Enforces timeout
         Returns stdout/stderr text and duration.
         """
-        base_cmd = [self._cli_path]
-        if self._port_path:
-            base_cmd += ["--port", str(self._port_path)]
-        cmd = base_cmd + args
+        cmd = [*self._base_cmd, *args]
 
-        # Redact PSKs in logs
-        to_log: List[str] = []
-        for a in cmd:
-            if mask_psk and (isinstance(a, str) and "base64:" in a):
-                to_log.append("base64:<redacted>")
+        # Redact PSKs in logs; skipped entirely unless DEBUG is enabled
+        if log.isEnabledFor(logging.DEBUG):
+            if mask_psk:
+                to_log = ["base64:<redacted>" if "base64:" in a else a for a in cmd]
             else:
-                to_log.append(a)
-        log.debug("CLI exec: %s", " ".join(shlex.quote(x) for x in to_log))
-
-        # Suppress console on Windows
-        creationflags = 0
-        startupinfo = None
-        if os.name == "nt":
-            creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
-            try:
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0  # SW_HIDE
-            except Exception:
-                startupinfo = None
+                to_log = cmd
+            log.debug("CLI exec: %s", shlex.join(to_log))
 
         start = _now()
         try:
@@ -193,8 +279,9 @@ class DeviceBase:
                 text=True,
                 timeout=timeout_s,
                 shell=False,
-                creationflags=creationflags,
-                startupinfo=startupinfo,
+                # Suppress console on Windows
+                creationflags=_CREATIONFLAGS,
+                startupinfo=_STARTUPINFO,
             )
             dur = _now() - start
             return CliResult(
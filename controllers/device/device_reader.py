@@ -1,16 +1,20 @@
 # mesh_config/controllers/device_reader.py
 from __future__ import annotations
 
+import base64
 import logging
 from typing import List, Dict, Any, Optional
 
-from ._device_common import DeviceBase
+from ._device_common import DeviceBase, _backoff
 from models.device_model import DeviceModel, MeshChannel
 from google.protobuf.json_format import MessageToDict
 
 
 log = logging.getLogger(__name__)
 
+# Upper bound snapshot() waits for the constructor's background config warm-up
+CONFIG_WARMUP_WAIT_S = 10.0
+
 
 def _safe_getattr(obj, name, default=None):
     try:
@@ -56,6 +60,86 @@ def _read_position_precision(ch_like: Any) -> int:
         pass
     return 0
 
+
+def _role_name(ch: Any) -> str:
+    try:
+        return type(ch).Role.Name(ch.role)
+    except Exception:
+        return str(ch.role)
+
+
+def _channels_ready(lst: Any) -> bool:
+    """
+    Ready if we have the primary or any non-disabled channel with settings.
+    Reads protobuf fields directly (role compared as the enum int, not its name);
+    polled repeatedly while waiting for channels.
+    """
+    try:
+        if not (isinstance(lst, list) and len(lst) > 0):
+            return False
+        for ch in lst:
+            if hasattr(ch, "HasField"):
+                if int(ch.index) == 0:
+                    return True
+                if ch.HasField("settings") and ch.role != type(ch).DISABLED:
+                    return True
+            else:
+                d = _pb_to_dict(ch)
+                if int(d.get("index", 0)) == 0:
+                    return True
+                if (d.get("settings") or {}) and str(d.get("role")).upper() != 'DISABLED':
+                    return True
+    except Exception:
+        pass
+    return False
+
+
+def _channel_from_pb(ch: Any) -> Optional[MeshChannel]:
+    """
+    Build a MeshChannel straight from a protobuf Channel (no MessageToDict round-trip).
+    Mirrors _channel_from_dict: PSK as base64 text, role as its enum name.
+    Returns None for disabled channels or channels without settings.
+    """
+    role = _role_name(ch)
+    if not ch.HasField("settings") or role == "DISABLED":
+        return None
+    s = ch.settings
+    psk = base64.b64encode(s.psk).decode("ascii")
+    # Values below are already coerced to the field types, so skip pydantic validation;
+    # precision is clamped to the range MeshChannel's validator would enforce
+    return MeshChannel.model_construct(
+        index=int(ch.index),
+        name=(s.name or None),
+        uplink_enabled=bool(s.uplink_enabled),
+        downlink_enabled=bool(s.downlink_enabled),
+        position_precision=max(0, min(32, int(s.module_settings.position_precision))),
+        psk=psk,
+        psk_present=bool(psk),
+        role=role,
+    )
+
+
+def _channel_from_dict(chd: Dict[str, Any]) -> Optional[MeshChannel]:
+    """Same as _channel_from_pb for a MessageToDict-style channel dict."""
+    settings = chd.get("settings") or {}
+
+    # Skip channels that are explicitly disabled or have no settings
+    if not settings or str(chd.get("role")).upper() == 'DISABLED':
+        return None
+
+    psk = settings.get("psk")
+    return MeshChannel.model_construct(
+        index=int(chd.get("index", 0)),
+        name=(settings.get("name") or None),
+        uplink_enabled=bool(settings.get("uplinkEnabled", False)),
+        downlink_enabled=bool(settings.get("downlinkEnabled", False)),
+        position_precision=max(0, min(32, _read_position_precision(settings))),
+        psk=psk,
+        psk_present=bool(psk),
+        role=chd.get("role"),
+    )
+
+
 class DeviceReader(DeviceBase):
     """
     Read-only ops (unchanged logic). Uses the Python API to fetch complete state.
@@ -93,6 +177,9 @@ class DeviceReader(DeviceBase):
 
         ln = iface.localNode
 
+        # Let the background warm-up from __init__ finish first (normally already done)
+        self._config_ready.wait(CONFIG_WARMUP_WAIT_S)
+
         try:
             cfg_loaded = bool(getattr(getattr(ln, "localConfig", None), "device", None))
         except Exception:
@@ -116,29 +203,10 @@ class DeviceReader(DeviceBase):
             except Exception:
                 pass
             # Wait briefly for channels to populate (API is async)
-            import time as _time
-            def _ready(lst):
-                try:
-                    if not (isinstance(lst, list) and len(lst) > 0):
-                        return False
-                    # Ready if we have primary or any non-disabled with settings
-                    for _ch in lst:
-                        d = _pb_to_dict(_ch)
-                        if int(d.get("index", 0)) == 0:
-                            return True
-                        s = d.get("settings") or {}
-                        if s and str(d.get("role")).upper() != 'DISABLED':
-                            return True
-                except Exception:
-                    pass
-                return False
-
-            deadline = _time.monotonic() + 6.0
-            while _time.monotonic() < deadline:
+            for _ in _backoff(6.0):
                 ch_list = getattr(ln, "channels", None)
-                if _ready(ch_list):
+                if _channels_ready(ch_list):
                     break
-                _time.sleep(0.2)
             else:
                 ch_list = getattr(ln, "channels", None)
 
@@ -151,27 +219,12 @@ class DeviceReader(DeviceBase):
         module_cfg = _pb_to_dict(ln.moduleConfig)
         mesh_channels: List[MeshChannel] = []
         for ch in (ch_list or []):
-            chd = _pb_to_dict(ch)
-            settings = chd.get("settings") or {}
-            
-            # Skip channels that are explicitly disabled or have no settings
-            if not settings or str(chd.get("role")).upper() == 'DISABLED':
-                continue
-
-            psk = settings.get("psk")
-            mesh_channels.append(
-                MeshChannel(
-                    index=int(chd.get("index", 0)),
-                    name=(settings.get("name") or None),
-                    uplink_enabled=bool(settings.get("uplinkEnabled", False)),
-                    downlink_enabled=bool(settings.get("downlinkEnabled", False)),
-                    position_precision=_read_position_precision(settings),
-                    psk=psk,
-                    psk_present=bool(psk),
-                    role=chd.get("role"),
-                )
-            )
+            mc = _channel_from_pb(ch) if hasattr(ch, "HasField") else _channel_from_dict(_pb_to_dict(ch))
+            if mc is not None:
+                mesh_channels.append(mc)
 
+        # Sections are raw MessageToDict dicts (camelCase, extra keys): they still need validation
+        # to become sub-models. Prebuilt MeshChannel instances are passed through as-is.
         return DeviceModel(
             UserInfo=user,
             MetaData=metadata,
@@ -3,17 +3,34 @@ from __future__ import annotations
 
 import time
 import logging
+import threading
+from itertools import repeat
+from operator import attrgetter, itemgetter
 from typing import Dict, Any, List, Optional
 
 from ._device_common import DeviceBase, CliResult
 from .device_reader import DeviceReader
-from models.device_model import DeviceModel
+from models.device_model import DeviceModel, MeshChannel
+from controllers.json_codec import dumps_pretty
 
 log = logging.getLogger(__name__)
 
+# Pause before reconnecting when the applied changes make the device reboot
+REBOOT_SETTLE_S = 2.0
 
-def _lower_bool(v) -> str:
-    return "true" if bool(v) else "false"
+
+def _ch_set_args(fields: Dict[str, Any]) -> List[str]:
+    """--ch-set key value triples for one channel (PSK as base64:..., bools as lowercase true/false)."""
+    args: List[str] = []
+    for key, value in fields.items():
+        if key == "psk":
+            val = "default" if value == "default" else f"base64:{value}"
+        elif isinstance(value, bool):
+            val = "true" if value else "false"
+        else:
+            val = str(value)
+        args.extend(("--ch-set", key, val))
+    return args
 
 
 def _norm_text(v: Any) -> Optional[str]:
@@ -26,6 +43,173 @@ def _norm_text(v: Any) -> Optional[str]:
     return str(v)
 
 
+# Channel fields diffed besides psk/name: (model field, --ch-set key, UI default).
+# An edited value equal to the UI default is treated as noise when the original was None.
+_CH_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ("uplink_enabled", "uplink_enabled", False),
+    ("downlink_enabled", "downlink_enabled", False),
+    ("position_precision", "module_settings.position_precision", 0),
+)
+
+_get_index = attrgetter("index")
+
+# Keys whose values are masked in the "updates" log
+_REDACT_KEYS = frozenset({"psk", "password", "pin", "wifi_psk", "fixed_pin", "wifiPsk", "fixedPin", "mqtt.password"})
+
+
+class _LazyJson:
+    """Log argument that serializes to indented JSON only if a handler actually formats the record."""
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return dumps_pretty(self.obj)
+
+
+def _is_empty(v: Any) -> bool:
+    return v is None or v == "" or v == [] or v == {}
+
+
+# Diffed config fields, flattened once at import:
+# (diff section, DeviceModel section, model field, CLI field, is_bool)
+# Diffs are keyed by the short CLI field; the "<section>." prefix is added when the
+# --set args are built. is_bool keys are sent as lowercase true/false even when the
+# value isn't a bool.
+_SECTION_FIELDS: tuple[tuple[str, str, str, str, bool], ...] = (
+    ("device", "Device", "role", "role", False),
+
+    ("lora", "Lora", "region", "region", False),
+    ("lora", "Lora", "modemPreset", "modem_preset", False),
+    ("lora", "Lora", "channelNum", "channel_num", False),
+    ("lora", "Lora", "hopLimit", "hop_limit", False),
+    ("lora", "Lora", "txEnabled", "tx_enabled", True),
+    ("lora", "Lora", "txPower", "tx_power", False),
+
+    ("power", "Power", "lsSecs", "ls_secs", False),
+    ("power", "Power", "waitBluetoothSecs", "wait_bluetooth_secs", False),
+    ("power", "Power", "minWakeSecs", "min_wake_secs", False),
+
+    ("position", "Position", "gpsUpdateInterval", "gps_update_interval", False),
+    ("position", "Position", "positionBroadcastSmartEnabled", "position_broadcast_smart_enabled", True),
+    ("position", "Position", "broadcastSmartMinimumDistance", "broadcast_smart_minimum_distance", False),
+    ("position", "Position", "broadcastSmartMinimumIntervalSecs", "broadcast_smart_minimum_interval_secs", False),
+    ("position", "Position", "positionBroadcastSecs", "position_broadcast_secs", False),
+
+    ("display", "Display", "screenOnSecs", "screen_on_secs", False),
+    ("display", "Display", "gpsFormat", "gps_format", False),
+    ("display", "Display", "autoScreenCarouselSecs", "auto_screen_carousel_secs", False),
+    ("display", "Display", "units", "units", False),
+    ("display", "Display", "oled", "oled", False),
+    ("display", "Display", "displaymode", "displaymode", False),
+    ("display", "Display", "headingBold", "heading_bold", True),
+    ("display", "Display", "flipScreen", "flip_screen", True),
+    ("display", "Display", "compassNorthTop", "compass_north_top", True),
+    ("display", "Display", "wakeOnTapOrMotion", "wake_on_tap_or_motion", True),
+    ("display", "Display", "compassOrientation", "compass_orientation", False),
+    ("display", "Display", "use12hClock", "use_12h_clock", True),
+
+    ("bluetooth", "BlueTooth", "enabled", "enabled", True),
+    ("bluetooth", "BlueTooth", "fixedPin", "fixed_pin", False),
+    ("bluetooth", "BlueTooth", "mode", "mode", False),
+
+    ("network", "Network", "ntpServer", "ntp_server", False),
+    ("network", "Network", "wifiEnabled", "wifi_enabled", True),
+    ("network", "Network", "wifiSsid", "wifi_ssid", False),
+    ("network", "Network", "wifiPsk", "wifi_psk", False),
+    ("network", "Network", "ethEnabled", "eth_enabled", True),
+    ("network", "Network", "rsyslogServer", "rsyslog_server", False),
+)
+
+# ModuleConfig fields: (module, model field, CLI key, is_bool); CLI keys are "<module>.<field>"
+_MODULE_FIELDS: tuple[tuple[str, str, str, bool], ...] = tuple(
+    (module, key, f"{module}.{key}", key in bools)
+    for module, keys, bools in (
+        ("mqtt",
+         ("enabled", "address", "username", "password", "root", "json_enabled", "tls_enabled",
+          "proxy_to_client_enabled", "map_reporting_enabled"),
+         {"enabled", "json_enabled", "tls_enabled", "proxy_to_client_enabled", "map_reporting_enabled"}),
+        ("serial",
+         ("enabled", "echo", "rxd", "txd", "baud", "timeout", "mode", "override_console_serial_port"),
+         {"enabled", "echo", "override_console_serial_port"}),
+        ("store_forward",
+         ("enabled", "heartbeat", "records", "history_return_max", "history_return_window", "is_server"),
+         {"enabled", "heartbeat", "is_server"}),
+        ("range_test",
+         ("enabled", "sender", "save"),
+         {"enabled", "save"}),
+        ("telemetry",
+         ("device_update_interval", "environment_update_interval", "environment_measurement_enabled",
+          "environment_screen_enabled", "environment_display_fahrenheit", "air_quality_enabled",
+          "air_quality_interval", "power_measurement_enabled", "power_update_interval", "power_screen_enabled",
+          "health_measurement_enabled", "health_update_interval", "health_screen_enabled"),
+         {"environment_measurement_enabled", "environment_screen_enabled", "environment_display_fahrenheit",
+          "air_quality_enabled", "power_measurement_enabled", "power_screen_enabled",
+          "health_measurement_enabled", "health_screen_enabled"}),
+        ("canned_message",
+         ("enabled", "allow_input_source", "send_bell"),
+         {"enabled", "send_bell"}),
+        ("audio",
+         ("codec2_enabled", "ptt_pin", "bitrate", "i2s_ws", "i2s_sd", "i2s_din", "i2s_sck"),
+         {"codec2_enabled"}),
+        ("remote_hardware",
+         ("enabled",),
+         {"enabled"}),
+        ("neighbor_info",
+         ("enabled", "update_interval", "transmit_over_lora"),
+         {"enabled", "transmit_over_lora"}),
+        ("ambient_lighting",
+         ("led_state", "current", "red", "green", "blue"),
+         {"led_state"}),
+        ("detection_sensor",
+         ("enabled", "minimum_broadcast_secs", "detection_trigger_type", "state_broadcast_secs",
+          "send_bell", "name", "monitor_pin", "use_pullup"),
+         {"enabled", "send_bell", "use_pullup"}),
+        ("paxcounter",
+         ("enabled", "paxcounter_update_interval"),
+         {"enabled"}),
+    )
+    for key in keys
+)
+
+# Every full CLI key flagged is_bool above; keys are section-prefixed, so one set serves all sections
+_BOOL_CLI_KEYS = frozenset(
+    [f"{sect}.{cf}" for sect, _, _, cf, is_bool in _SECTION_FIELDS if is_bool]
+    + [ck for _, _, ck, is_bool in _MODULE_FIELDS if is_bool]
+)
+
+
+def _tuple_getter(keys: tuple[str, ...]):
+    """attrgetter that always returns a tuple (attrgetter with one name returns the bare value)."""
+    get = attrgetter(*keys)
+    return get if len(keys) > 1 else (lambda obj: (get(obj),))
+
+
+def _group_fields(rows, owner_of, key_of, target_of) -> tuple:
+    """
+    Group field rows by the object they are read from: (owner, getter, targets), where getter
+    pulls all of that owner's fields in one C-level call and targets line up with its result.
+    """
+    groups: Dict[str, List[tuple]] = {}
+    for row in rows:
+        groups.setdefault(owner_of(row), []).append(row)
+    return tuple(
+        (owner, _tuple_getter(tuple(key_of(r) for r in grp)), tuple(target_of(r) for r in grp))
+        for owner, grp in groups.items()
+    )
+
+
+# _SECTION_FIELDS per DeviceModel section: (section, getter, ((diff section, CLI field), ...))
+_SECTION_GROUPS = _group_fields(_SECTION_FIELDS, itemgetter(1), itemgetter(2), itemgetter(0, 3))
+# _MODULE_FIELDS per module: (module, getter, (CLI key, ...))
+_MODULE_GROUPS = _group_fields(_MODULE_FIELDS, itemgetter(0), itemgetter(1), itemgetter(2))
+
+# Prefix that turns a diff key into its CLI key; module diff keys are already "<module>.<field>"
+_CLI_PREFIX = {sect: f"{sect}." for sect, *_ in _SECTION_FIELDS}
+_CLI_PREFIX["modules"] = ""
+
+
 class DeviceWriterCLI(DeviceBase):
     """
     CLI-backed writer:
@@ -35,18 +219,15 @@ class DeviceWriterCLI(DeviceBase):
     - Returns ApplyReport
     """
 
-    _REBOOT_SUSPECTS = {
-        ("device", "role"),
-        ("lora", "region"),
-        ("lora", "modem_preset"),
-        ("bluetooth", "enabled"),
-    }
+    # (diff section, CLI field) pairs whose change makes the device reboot
+    _REBOOT_KEYS = (("device", "role"), ("lora", "region"), ("lora", "modem_preset"), ("bluetooth", "enabled"))
 
-    _REDACT_KEYS = {"psk", "password", "pin", "wifi_psk", "fixed_pin", "wifiPsk", "fixedPin"}
+    # Sections written with plain `--set key value`; batched into one CLI call by _exec_settings
+    _SET_SECTIONS = ("device", "lora", "power", "position", "display", "bluetooth", "network", "modules")
 
-    def __init__(self, port: Optional[str] = None, iface=None):
-        super().__init__(port=port, iface=iface)
-        self.reader = DeviceReader(iface=self._iface)
+    def __init__(self, port: Optional[str] = None, iface=None, config_ready: Optional[threading.Event] = None):
+        super().__init__(port=port, iface=iface, config_ready=config_ready)
+        self.reader = DeviceReader(iface=self._iface, config_ready=self._config_ready)
 
     def apply_from_models(self, original: DeviceModel, edited: DeviceModel) -> Dict[str, Any]:
         """
@@ -84,41 +265,43 @@ class DeviceWriterCLI(DeviceBase):
         reboot_expected = self._is_reboot_expected(diff)
         log.info("reboot_expected=%s", reboot_expected)
 
+        # All plain --set sections go out in one CLI call; owner and channels need their own flags.
+        # Each step returns {section: result} so the report stays per section.
         execution_plan = [
-            ("device", self._exec_device, diff["device"]),
-            ("owner", self._exec_owner, diff["owner"]),
-            ("lora", self._exec_lora, diff["lora"]),
-            ("power", self._exec_power, diff["power"]),
-            ("position", self._exec_position, diff["position"]),
-            ("display", self._exec_display, diff["display"]),
-            ("bluetooth", self._exec_bluetooth, diff["bluetooth"]),
-            ("network", self._exec_network, diff["network"]),
-            ("channels", self._exec_channels, diff["channels"]),
-            ("modules", self._exec_modules, diff["modules"]),
+            ("settings", self._exec_settings, {sec: diff[sec] for sec in self._SET_SECTIONS if diff.get(sec)}),
+            ("owner", lambda p: {"owner": self._exec_owner(p)}, diff["owner"]),
+            ("channels", lambda p: {"channels": self._exec_channels(p)}, diff["channels"]),
         ]
 
         any_success = False
         try:
-            for section, fn, payload in execution_plan:
+            for step, fn, payload in execution_plan:
                 if not payload:
                     continue
-                sec_res = fn(payload)
-                report["sections"][section] = sec_res
-                if sec_res.get("status") == "success":
-                    any_success = True
-                elif sec_res.get("status") != "no_change":
-                    report["status"] = "error"
-                    report["errors"].append({section: sec_res})
-                    log.warning("aborting after section=%s; status=%s", section, sec_res.get("status"))
+                failed: List[str] = []
+                for section, sec_res in fn(payload).items():
+                    report["sections"][section] = sec_res
+                    if sec_res.get("status") == "success":
+                        any_success = True
+                    elif sec_res.get("status") != "no_change":
+                        report["status"] = "error"
+                        report["errors"].append({section: sec_res})
+                        failed.append(f"{section}={sec_res.get('status')}")
+                if failed:
+                    log.warning("aborting after step=%s; %s", step, ", ".join(failed))
                     break
 
+            # Firmware commits and usually reboots after any successful write, not only for the
+            # _REBOOT_KEYS; reopening right away could attach to the node just before it goes down
             if reboot_expected or any_success:
-                log.info("waiting 2.0s before reconnect...")
-                time.sleep(2.0)
+                log.info("waiting %.1fs for reboot before reconnect...", REBOOT_SETTLE_S)
+                time.sleep(REBOOT_SETTLE_S)
 
             try:
                 log.info("attempting reconnect...")
                 self._reconnect_after_cli(wait_ready_s=15.0)
+                # The reader still holds the interface closed by _detach_for_cli
+                self.reader._iface = self._iface
                 post_snapshot = self.reader.snapshot(force_refresh=True)
                 report["post_snapshot"] = post_snapshot
                 log.info("reconnect and post-apply snapshot successful")
@@ -133,122 +316,30 @@ class DeviceWriterCLI(DeviceBase):
         return report
 
     def _build_diff(self, original: DeviceModel, edited: DeviceModel) -> Dict[str, Any]:
-        o = original.model_dump()
-        e = edited.model_dump()
-
-        def sec_diff(sec: str, mapping: Dict[str, str]) -> Dict[str, Any]:
-            out: Dict[str, Any] = {}
-            o_sec, e_sec = o.get(sec) or {}, e.get(sec) or {}
-            for model_key, cli_key in mapping.items():
-                ov, ev = o_sec.get(model_key), e_sec.get(model_key)
-                if ev is not None and ov != ev:
-                    out[cli_key] = ev
-            return out
-
-        DEVICE_MAP = {"role": "device.role"}
-        LORA_MAP = {
-            "region": "lora.region", "modemPreset": "lora.modem_preset", "channelNum": "lora.channel_num",
-            "hopLimit": "lora.hop_limit", "txEnabled": "lora.tx_enabled", "txPower": "lora.tx_power",
-        }
-        POWER_MAP = {
-            "lsSecs": "power.ls_secs", "waitBluetoothSecs": "power.wait_bluetooth_secs",
-            "minWakeSecs": "power.min_wake_secs",
-        }
-        POSITION_MAP = {
-            "gpsUpdateInterval": "position.gps_update_interval",
-            "positionBroadcastSmartEnabled": "position.position_broadcast_smart_enabled",
-            "broadcastSmartMinimumDistance": "position.broadcast_smart_minimum_distance",
-            "broadcastSmartMinimumIntervalSecs": "position.broadcast_smart_minimum_interval_secs",
-            "positionBroadcastSecs": "position.position_broadcast_secs",
-        }
-        DISPLAY_MAP = {
-            "screenOnSecs": "display.screen_on_secs", "gpsFormat": "display.gps_format",
-            "autoScreenCarouselSecs": "display.auto_screen_carousel_secs", "units": "display.units",
-            "oled": "display.oled", "displaymode": "display.displaymode", "headingBold": "display.heading_bold",
-            "flipScreen": "display.flip_screen", "compassNorthTop": "display.compass_north_top",
-            "wakeOnTapOrMotion": "display.wake_on_tap_or_motion", "compassOrientation": "display.compass_orientation",
-            "use12hClock": "display.use_12h_clock",
-        }
-        BLUETOOTH_MAP = {
-            "enabled": "bluetooth.enabled", "fixedPin": "bluetooth.fixed_pin", "mode": "bluetooth.mode",
-        }
-        NETWORK_MAP = {
-            "ntpServer": "network.ntp_server", "wifiEnabled": "network.wifi_enabled",
-            "wifiSsid": "network.wifi_ssid", "wifiPsk": "network.wifi_psk", "ethEnabled": "network.eth_enabled",
-            "rsyslogServer": "network.rsyslog_server",
-        }
-
-        MODULE_MAPS = {
-            "mqtt": {
-                "enabled": "mqtt.enabled", "address": "mqtt.address", "username": "mqtt.username",
-                "password": "mqtt.password", "root": "mqtt.root", "json_enabled": "mqtt.json_enabled",
-                "tls_enabled": "mqtt.tls_enabled", "proxy_to_client_enabled": "mqtt.proxy_to_client_enabled",
-                "map_reporting_enabled": "mqtt.map_reporting_enabled"
-            },
-            "serial": {
-                "enabled": "serial.enabled", "echo": "serial.echo", "rxd": "serial.rxd", "txd": "serial.txd",
-                "baud": "serial.baud", "timeout": "serial.timeout", "mode": "serial.mode",
-                "override_console_serial_port": "serial.override_console_serial_port"
-            },
-            "store_forward": {
-                "enabled": "store_forward.enabled", "heartbeat": "store_forward.heartbeat", "records": "store_forward.records",
-                "history_return_max": "store_forward.history_return_max", "history_return_window": "store_forward.history_return_window",
-                "is_server": "store_forward.is_server"
-            },
-            "range_test": {
-                "enabled": "range_test.enabled", "sender": "range_test.sender", "save": "range_test.save"
-            },
-            "telemetry": {
-                "device_update_interval": "telemetry.device_update_interval", "environment_update_interval": "telemetry.environment_update_interval",
-                "environment_measurement_enabled": "telemetry.environment_measurement_enabled", "environment_screen_enabled": "telemetry.environment_screen_enabled",
-                "environment_display_fahrenheit": "telemetry.environment_display_fahrenheit", "air_quality_enabled": "telemetry.air_quality_enabled",
-                "air_quality_interval": "telemetry.air_quality_interval", "power_measurement_enabled": "telemetry.power_measurement_enabled",
-                "power_update_interval": "telemetry.power_update_interval", "power_screen_enabled": "telemetry.power_screen_enabled",
-                "health_measurement_enabled": "telemetry.health_measurement_enabled", "health_update_interval": "telemetry.health_update_interval",
-                "health_screen_enabled": "telemetry.health_screen_enabled"
-            },
-            "canned_message": {
-                "enabled": "canned_message.enabled", "allow_input_source": "canned_message.allow_input_source", "send_bell": "canned_message.send_bell"
-            },
-            "audio": {
-                "codec2_enabled": "audio.codec2_enabled", "ptt_pin": "audio.ptt_pin", "bitrate": "audio.bitrate",
-                "i2s_ws": "audio.i2s_ws", "i2s_sd": "audio.i2s_sd", "i2s_din": "audio.i2s_din", "i2s_sck": "audio.i2s_sck"
-            },
-            "remote_hardware": {"enabled": "remote_hardware.enabled"},
-            "neighbor_info": {
-                "enabled": "neighbor_info.enabled", "update_interval": "neighbor_info.update_interval",
-                "transmit_over_lora": "neighbor_info.transmit_over_lora"
-            },
-            "ambient_lighting": {
-                "led_state": "ambient_lighting.led_state", "current": "ambient_lighting.current", "red": "ambient_lighting.red",
-                "green": "ambient_lighting.green", "blue": "ambient_lighting.blue"
-            },
-            "detection_sensor": {
-                "enabled": "detection_sensor.enabled", "minimum_broadcast_secs": "detection_sensor.minimum_broadcast_secs",
-                "detection_trigger_type": "detection_sensor.detection_trigger_type", "state_broadcast_secs": "detection_sensor.state_broadcast_secs",
-                "send_bell": "detection_sensor.send_bell", "name": "detection_sensor.name", "monitor_pin": "detection_sensor.monitor_pin",
-                "use_pullup": "detection_sensor.use_pullup"
-            },
-            "paxcounter": {
-                "enabled": "paxcounter.enabled", "paxcounter_update_interval": "paxcounter.paxcounter_update_interval"
-            }
-        }
-
-        diff = {
-            "device": sec_diff("Device", DEVICE_MAP),
-            "owner": {},
-            "lora": sec_diff("Lora", LORA_MAP),
-            "power": sec_diff("Power", POWER_MAP),
-            "position": sec_diff("Position", POSITION_MAP),
-            "display": sec_diff("Display", DISPLAY_MAP),
-            "bluetooth": sec_diff("BlueTooth", BLUETOOTH_MAP),
-            "network": sec_diff("Network", NETWORK_MAP),
-            "channels": self._diff_channels(o.get("MeshChannels") or [], e.get("MeshChannels") or []),
-            "modules": {},
-        }
+        # Read the mapped fields straight off the models; a model_dump() of both trees would
+        # copy every section, module and channel just to look at a few dozen scalars
+        o, e = original, edited
+
+        # Unchanged models (e.g. a repeated Apply): pydantic's == compares the field values
+        # in one go, so skip the per-field walk entirely
+        if o is e or o == e:
+            return self._empty_diff()
+
+        diff = self._empty_diff()
+        diff["channels"] = self._diff_channels(o.MeshChannels or [], e.MeshChannels or [])
+
+        for src, get_fields, targets in _SECTION_GROUPS:
+            e_sec = getattr(e, src, None)
+            if e_sec is None:
+                continue  # every edited value reads as None; nothing to write
+            o_sec = getattr(o, src, None)
+            o_vals = get_fields(o_sec) if o_sec is not None else repeat(None)
+            for (sect, cli_field), ov, ev in zip(targets, o_vals, get_fields(e_sec)):
+                if ev is not None and ev != ov:
+                    diff[sect][cli_field] = ev
 
         # --- Fix bluetooth.fixed_pin: drop empty; coerce numeric string to int ---
-        bt_key = "bluetooth.fixed_pin"
+        bt_key = "fixed_pin"
         if bt_key in diff["bluetooth"]:
             val = diff["bluetooth"][bt_key]
             if isinstance(val, str):
@@ -259,7 +350,7 @@ class DeviceWriterCLI(DeviceBase):
                     diff["bluetooth"][bt_key] = int(s)   # send as integer
 
         # --- ModuleConfig diffs with default False suppression & blank normalization ---
-        o_mc, e_mc = o.get("ModuleConfig") or {}, e.get("ModuleConfig") or {}
+        o_mc, e_mc = o.ModuleConfig, e.ModuleConfig
 
         def _norm(v):
             if isinstance(v, str):
@@ -267,11 +358,13 @@ class DeviceWriterCLI(DeviceBase):
                 return v if v else None
             return v
 
-        for module_name, mapping in MODULE_MAPS.items():
-            o_sec = o_mc.get(module_name) or {}
-            e_sec = e_mc.get(module_name) or {}
-            for model_key, cli_key in mapping.items():
-                ov, ev = o_sec.get(model_key), e_sec.get(model_key)
+        for module_name, get_fields, cli_keys in _MODULE_GROUPS:
+            e_sec = getattr(e_mc, module_name, None)
+            if e_sec is None:
+                continue  # every edited value reads as None (blank); nothing to write
+            o_sec = getattr(o_mc, module_name, None)
+            o_vals = get_fields(o_sec) if o_sec is not None else repeat(None)
+            for cli_key, ov, ev in zip(cli_keys, o_vals, get_fields(e_sec)):
                 ovn, evn = _norm(ov), _norm(ev)
 
                 if evn is None:
@@ -285,61 +378,65 @@ class DeviceWriterCLI(DeviceBase):
                     diff["modules"][cli_key] = evn
 
         # Owner names (special CLI)
-        o_user, e_user = o.get("UserInfo") or {}, e.get("UserInfo") or {}
-        long_o, long_e = o_user.get("longName"), e_user.get("longName")
-        short_o, short_e = o_user.get("shortName"), e_user.get("shortName")
+        o_user, e_user = o.UserInfo, e.UserInfo
+        long_o, long_e = getattr(o_user, "longName", None), getattr(e_user, "longName", None)
+        short_o, short_e = getattr(o_user, "shortName", None), getattr(e_user, "shortName", None)
         if long_e is not None and long_e != long_o:
             diff["owner"]["owner_long"] = long_e
         if short_e is not None and short_e != short_o:
             diff["owner"]["owner_short"] = short_e
-        import json
-        log.info("updates: %s\n", json.dumps(self._redact(diff), indent=2, default=str))
+        if log.isEnabledFor(logging.INFO):
+            log.info("updates: %s\n", _LazyJson(self._redact(diff)))
         return diff
 
 
-    def _diff_channels(self, orig: List[Dict[str, Any]], edit: List[Dict[str, Any]]) -> Dict[str, Any]:
-        by_idx_o = {c["index"]: c for c in orig}
-        by_idx_e = {c["index"]: c for c in edit}
+    @staticmethod
+    def _empty_diff() -> Dict[str, Any]:
+        return {
+            "device": {},
+            "owner": {},
+            "lora": {},
+            "power": {},
+            "position": {},
+            "display": {},
+            "bluetooth": {},
+            "network": {},
+            "channels": {"deletes": [], "upserts": []},
+            "modules": {},
+        }
+
+    def _diff_channels(self, orig: List[MeshChannel], edit: List[MeshChannel]) -> Dict[str, Any]:
+        by_idx_o = dict(zip(map(_get_index, orig), orig))
+        by_idx_e = dict(zip(map(_get_index, edit), edit))
 
         # Deletions: never delete index 0
         deletes = [idx for idx in by_idx_o if idx != 0 and idx not in by_idx_e]
         upserts: List[Dict[str, Any]] = []
 
-        # Values that are “defaults” commonly injected by UI when no value was set
-        suppress_if_none_defaults = {
-            "uplink_enabled": False,
-            "downlink_enabled": False,
-            "position_precision": 0,
-        }
-
-        for idx, ed_ch in sorted(by_idx_e.items()):
+        for idx, ed_ch in sorted(by_idx_e.items(), key=itemgetter(0)):
             fields: Dict[str, Any] = {}
-            orig_ch = by_idx_o.get(idx, {})
+            orig_ch = by_idx_o.get(idx)
 
             # PSK: normalized compare (None/'' treated the same)
-            psk_o = _norm_text(orig_ch.get("psk"))
-            psk_e = _norm_text(ed_ch.get("psk"))
+            psk_o = _norm_text(getattr(orig_ch, "psk", None))
+            psk_e = _norm_text(ed_ch.psk)
             if psk_o != psk_e:
                 fields["psk"] = psk_e or "default"
 
             # Name: straight compare, but only if explicitly provided
-            name_o, name_e = orig_ch.get("name"), ed_ch.get("name")
+            name_o, name_e = getattr(orig_ch, "name", None), ed_ch.name
             if name_e is not None and name_e != name_o:
                 fields["name"] = name_e
 
             # Other fields (keep them all eligible), but suppress None→default noise
-            for model_key, cli_key in [
-                ("uplink_enabled", "uplink_enabled"),
-                ("downlink_enabled", "downlink_enabled"),
-                ("position_precision", "module_settings.position_precision"),
-            ]:
-                val_o = orig_ch.get(model_key)
-                val_e = ed_ch.get(model_key)
+            for model_key, cli_key, ui_default in _CH_FIELDS:
+                val_o = getattr(orig_ch, model_key, None)
+                val_e = getattr(ed_ch, model_key)
                 if val_e is None:
                     continue
 
-                # If original was None and edited equals a known default, treat as UI noise
-                if model_key in suppress_if_none_defaults and val_o is None and val_e == suppress_if_none_defaults[model_key]:
+                # If original was None and edited equals the UI default, treat as UI noise
+                if val_o is None and val_e == ui_default:
                     continue
 
                 if val_o != val_e:
@@ -355,29 +452,31 @@ class DeviceWriterCLI(DeviceBase):
         return {"deletes": sorted(deletes, reverse=True), "upserts": upserts}
     
 
-    def _exec_generic(self, section_name: str, changes: Dict[str, Any], bool_keys: List[str] | set = ()) -> Dict[str, Any]:
-        if not changes:
-            return {"status": "no_change"}
-
-        # support set/list for membership
-        bool_keys = set(bool_keys) if not isinstance(bool_keys, set) else bool_keys
-
-        # Stable ordering helps with logs/tests
+    @staticmethod
+    def _set_args(changes: Dict[str, Any], prefix: str = "", bool_keys: frozenset = _BOOL_CLI_KEYS) -> List[str]:
+        # Stable ordering helps with logs/tests (keys are unique, so values are never compared)
         args: List[str] = []
-        for k in sorted(changes.keys()):
-            v = changes[k]
+        for k, v in sorted(changes.items()):
+            k = prefix + k
             # Treat as boolean either if key is declared or value is literally a bool
-            val = _lower_bool(v) if (k in bool_keys or isinstance(v, bool)) else str(v)
+            val = ("true" if v else "false") if (k in bool_keys or isinstance(v, bool)) else str(v)
             args.extend(["--set", k, val])
+        return args
 
-        res = self._run_cli_logged(section_name, args, timeout_s=20.0)
-        return self._to_section_result(res, fields=sorted(changes.keys()))
-    
-
-    def _exec_device(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        args = ["--set", next(iter(changes.keys())), str(next(iter(changes.values())))]
-        res = self._run_cli_logged("device", args, timeout_s=20.0)
-        return self._to_section_result(res, fields=list(changes.keys()))
+    def _exec_settings(self, sections: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Write every changed plain `--set` section (device, lora, ..., modules) in a single CLI
+        invocation, so N sections cost one process spawn + serial handshake instead of N.
+        Returns one result per section; they share the invocation's status and output.
+        """
+        args: List[str] = []
+        for sec, changes in sections.items():
+            args.extend(self._set_args(changes, _CLI_PREFIX[sec]))
+        if not args:
+            return {}
+        # Worst case stays what the per-section calls allowed in total
+        res = self._run_cli_logged(",".join(sections), args, timeout_s=20.0 * len(sections))
+        return {sec: self._to_section_result(res, fields=sorted(changes.keys())) for sec, changes in sections.items()}
 
     def _exec_owner(self, changes: Dict[str, Any]) -> Dict[str, Any]:
         args = []
@@ -390,29 +489,6 @@ class DeviceWriterCLI(DeviceBase):
         res = self._run_cli_logged("owner", args, timeout_s=20.0)
         return self._to_section_result(res, fields=list(changes.keys()))
 
-    def _exec_lora(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        return self._exec_generic("lora", changes, bool_keys=["lora.tx_enabled"])
-
-    def _exec_power(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        return self._exec_generic("power", changes)
-
-    def _exec_position(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        return self._exec_generic("position", changes, bool_keys=["position.position_broadcast_smart_enabled"])
-
-    def _exec_display(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        bool_keys = [
-            "display.heading_bold", "display.flip_screen", "display.compass_north_top",
-            "display.wake_on_tap_or_motion", "display.use_12h_clock"
-        ]
-        return self._exec_generic("display", changes, bool_keys=bool_keys)
-
-    def _exec_bluetooth(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        return self._exec_generic("bluetooth", changes, bool_keys=["bluetooth.enabled"])
-
-    def _exec_network(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        bool_keys = ["network.wifi_enabled", "network.eth_enabled"]
-        return self._exec_generic("network", changes, bool_keys=bool_keys)
-
     def _exec_channels(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         results = {"deleted": [], "upserts": []}
         overall_status = "no_change"
@@ -431,15 +507,8 @@ class DeviceWriterCLI(DeviceBase):
 
             # Primary (index 0): always update in place via --ch-index 0
             if int(idx) == 0:
-                args = ["--ch-index", "0"]
                 # Apply fields (including name if provided)
-                for key, value in fields.items():
-                    if key == "psk":
-                        val = "default" if value == "default" else f"base64:{value}"
-                        args.extend(["--ch-set", "psk", val])
-                    else:
-                        val = _lower_bool(value) if isinstance(value, bool) else str(value)
-                        args.extend(["--ch-set", key, val])
+                args = ["--ch-index", "0", *_ch_set_args(fields)]
                 res = self._run_cli_logged("channels:set[0]", args, timeout_s=25.0)
             else:
                 if is_new:
@@ -447,25 +516,11 @@ class DeviceWriterCLI(DeviceBase):
                     add_name = fields.pop("name", None)
                     if not add_name:
                         add_name = f"Channel {idx}"
-                    args = ["--ch-add", str(add_name)]
-                    for key, value in fields.items():
-                        if key == "psk":
-                            val = "default" if value == "default" else f"base64:{value}"
-                            args.extend(["--ch-set", "psk", val])
-                        else:
-                            val = _lower_bool(value) if isinstance(value, bool) else str(value)
-                            args.extend(["--ch-set", key, val])
+                    args = ["--ch-add", str(add_name), *_ch_set_args(fields)]
                     res = self._run_cli_logged(f"channels:add[{add_name}]", args, timeout_s=25.0)
                 else:
                     # Existing secondary: update in place
-                    args = ["--ch-index", str(idx)]
-                    for key, value in fields.items():
-                        if key == "psk":
-                            val = "default" if value == "default" else f"base64:{value}"
-                            args.extend(["--ch-set", "psk", val])
-                        else:
-                            val = _lower_bool(value) if isinstance(value, bool) else str(value)
-                            args.extend(["--ch-set", key, val])
+                    args = ["--ch-index", str(idx), *_ch_set_args(fields)]
                     res = self._run_cli_logged(f"channels:set[{idx}]", args, timeout_s=25.0)
             results["upserts"].append({"index": idx, **self._to_section_result(res, fields=list(fields.keys()))})
             if res.returncode != 0:
@@ -474,34 +529,8 @@ class DeviceWriterCLI(DeviceBase):
 
         return {"status": overall_status, **results}
 
-    def _exec_modules(self, changes: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Execute module changes via generic --set calls.
-        Keys look like: "mqtt.enabled", "telemetry.device_update_interval", etc.
-        """
-        bool_keys = {
-            "mqtt.enabled", "mqtt.json_enabled", "mqtt.tls_enabled", "mqtt.proxy_to_client_enabled", "mqtt.map_reporting_enabled",
-            "serial.enabled", "serial.echo", "serial.override_console_serial_port",
-            "store_forward.enabled", "store_forward.heartbeat", "store_forward.is_server",
-            "range_test.enabled", "range_test.save",
-            "telemetry.environment_measurement_enabled", "telemetry.environment_screen_enabled", "telemetry.environment_display_fahrenheit",
-            "telemetry.air_quality_enabled", "telemetry.power_measurement_enabled", "telemetry.power_screen_enabled",
-            "telemetry.health_measurement_enabled", "telemetry.health_screen_enabled",
-            "canned_message.enabled", "canned_message.send_bell",
-            "audio.codec2_enabled",
-            "remote_hardware.enabled",
-            "neighbor_info.enabled", "neighbor_info.transmit_over_lora",
-            "ambient_lighting.led_state",
-            "detection_sensor.enabled", "detection_sensor.send_bell", "detection_sensor.use_pullup",
-            "paxcounter.enabled",
-        }
-        return self._exec_generic("modules", changes, bool_keys=bool_keys)
-
     def _is_reboot_expected(self, diff: Dict[str, Any]) -> bool:
-        for sec, key in self._REBOOT_SUSPECTS:
-            if diff.get(sec) and any(k.endswith(key) for k in diff[sec].keys()):
-                return True
-        return False
+        return any(key in (diff.get(sec) or ()) for sec, key in self._REBOOT_KEYS)
 
     def _run_cli_logged(self, section: str, args: List[str], *, timeout_s: float) -> CliResult:
         s_args = self._sanitize_args(args)
@@ -510,15 +539,20 @@ class DeviceWriterCLI(DeviceBase):
         return res
 
     def _sanitize_args(self, args: List[str]) -> List[str]:
+        # Only --ch-set psk values are secret; --set-only calls are returned as-is (no copy)
+        if "--ch-set" not in args:
+            return args
         out = args[:]
-        i = 0
-        while i < len(out):
-            if out[i] == "--ch-set" and (i + 1 < len(out)) and out[i+1] == "psk":
-                if i + 2 < len(out):
+        # Jump between --ch-set tokens instead of visiting every arg
+        i = -1
+        try:
+            while True:
+                i = out.index("--ch-set", i + 1)
+                if i + 2 < len(out) and out[i + 1] == "psk":
                     out[i + 2] = self._redact_value(out[i + 2])
-                i += 3
-            else:
-                i += 1
+                    i += 2
+        except ValueError:
+            pass
         return out
 
     def _redact_value(self, val: str) -> str:
@@ -528,38 +562,36 @@ class DeviceWriterCLI(DeviceBase):
 
     def _redact(self, obj: Any) -> Any:
         """
-        Recursively traverses an object to redact specified keys and remove empty values.
+        Recursively redacts specified keys and removes empty values in a single pass:
+        each child is redacted and filtered as the output container is built.
         """
-        # Base case for non-collection types
-        if not isinstance(obj, (dict, list)):
-            return obj
-
-        # Handle lists: recurse, then filter out empty items
-        if isinstance(obj, list):
-            processed_list = [self._redact(item) for item in obj]
-            # Keep items that are not considered empty
-            return [
-                item for item in processed_list
-                if item is not None and item != "" and item != [] and item != {}
-            ]
-
-        # Handle dictionaries: recurse, then filter out keys with empty values
+        # Scalars are handled inline; only containers recurse
+        containers = (dict, list)
         if isinstance(obj, dict):
+            redact_keys = _REDACT_KEYS
             new_dict = {}
             for k, v in obj.items():
                 # Redact keys first
-                if k in self._REDACT_KEYS:
+                if k in redact_keys:
                     new_dict[k] = "<redacted>"
                     continue
-
-                # Recurse on the value
-                processed_value = self._redact(v)
-                
-                # Add key-value pair only if the processed value is not empty
-                if processed_value is not None and processed_value != "" and processed_value != [] and processed_value != {}:
-                    new_dict[k] = processed_value
+                if isinstance(v, containers):
+                    v = self._redact(v)
+                if not _is_empty(v):
+                    new_dict[k] = v
             return new_dict
-        
+
+        if isinstance(obj, list):
+            new_list = []
+            for item in obj:
+                if isinstance(item, containers):
+                    item = self._redact(item)
+                if not _is_empty(item):
+                    new_list.append(item)
+            return new_list
+
+        # Non-collection types pass through
+        return obj
 
     def _to_section_result(self, res: CliResult, *, fields: List[str]) -> Dict[str, Any]:
         if res.returncode == 0:
@@ -1,11 +1,15 @@
 # mesh_config/controllers/device_controller.py
 from __future__ import annotations
 
+import time
 from typing import Optional, List, Dict, Any, Literal
 
 from .device.device_reader import DeviceReader
 from .device.device_writer_cli import DeviceWriterCLI
-from models.device_model import MeshChannel, DeviceModel
+from models.device_model import MeshChannel, DeviceModel, Device, UserInfo, Lora, Power, Position
+
+# How long a snapshot may be reused by the upsert_* shims before re-reading the device
+SNAPSHOT_TTL_S = 2.0
 
 
 class DeviceController:
@@ -18,18 +22,42 @@ class DeviceController:
     def __init__(self, port: Optional[str]):
         self.reader = DeviceReader(port=port)
         # Writer reuses same port path; it will close/reopen around CLI calls
-        self.writer = DeviceWriterCLI(iface=self.reader._iface)
+        self.writer = DeviceWriterCLI(iface=self.reader._iface, config_ready=self.reader._config_ready)
+        # (monotonic time, model) of the last snapshot; dropped on every write
+        self._snap_cache: Optional[tuple[float, DeviceModel]] = None
 
     # --------------- lifecycle ---------------
     def close(self) -> None:
+        self.invalidate_snapshot()
         self.reader.close()
 
+    # --------------- snapshot cache ---------------
+    def invalidate_snapshot(self) -> None:
+        self._snap_cache = None
+
+    def _cached_snapshot(self) -> DeviceModel:
+        """Last snapshot if younger than SNAPSHOT_TTL_S, else a fresh one. Callers must not mutate it."""
+        cached = self._snap_cache
+        if cached is not None and time.monotonic() - cached[0] < SNAPSHOT_TTL_S:
+            return cached[1]
+        return self.snapshot()
+
+    def _apply(self, orig: DeviceModel, edited: DeviceModel) -> Dict[str, Any]:
+        # Invalidate even if the apply raised: the device may have been partially written
+        try:
+            return self.writer.apply_from_models(orig, edited)
+        finally:
+            self.invalidate_snapshot()
+
     # --------------- READ API (unchanged) ---------------
     def identity(self, silent: bool = False) -> Dict[str, str]:
         return self.reader.identity(silent=silent)
 
     def snapshot(self) -> DeviceModel:
-        return self.reader.snapshot()
+        """Fresh read from the device; also primes the snapshot cache used by the upsert_* shims."""
+        model = self.reader.snapshot()
+        self._snap_cache = (time.monotonic(), model)
+        return model
 
     def list_channels(self) -> List[MeshChannel]:
         return self.reader.list_channels()
@@ -40,68 +68,153 @@ class DeviceController:
         Main entrypoint for your GUI's 'apply'. Provide the original snapshot and the edited model.
         Performs a diff and issues only the minimal CLI commands needed.
         """
-        return self.writer.apply_from_models(original, edited)
+        return self._apply(original, edited)
 
-    # Optional: maintain single-field upsert shims (map to edited model under the hood)
+    def begin_edit(self) -> "DeviceEditSession":
+        """
+        Start a batched edit against one snapshot. Every set_* call on the session only touches
+        the in-memory copy; commit() (or leaving the with-block cleanly) writes it in one apply.
+        """
+        return DeviceEditSession(self, self._cached_snapshot())
+
+    # Optional: maintain single-field upsert shims (thin wrappers over a one-call edit session)
     def upsert_device_role(self, role: str) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
-        edited.Device["role"] = role
-        return self.writer.apply_from_models(orig, edited)
+        with self.begin_edit() as s:
+            s.set_device_role(role)
+        return s.result
 
     def upsert_owner(self, owner_long: Optional[str], owner_short: Optional[str]) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
+        with self.begin_edit() as s:
+            s.set_owner(owner_long, owner_short)
+        return s.result
+
+    def upsert_lora(self, *, region, modem_preset, channel_num, hop_limit, tx_enabled, tx_power) -> Dict[str, Any]:
+        with self.begin_edit() as s:
+            s.set_lora(region=region, modem_preset=modem_preset, channel_num=channel_num,
+                       hop_limit=hop_limit, tx_enabled=tx_enabled, tx_power=tx_power)
+        return s.result
+
+    def upsert_power(self, *, light_sleep, wait_bt, min_wake) -> Dict[str, Any]:
+        with self.begin_edit() as s:
+            s.set_power(light_sleep=light_sleep, wait_bt=wait_bt, min_wake=min_wake)
+        return s.result
+
+    def upsert_position(self, *, gps_update_secs, use_smart_position, smart_min_dist_m, smart_min_interval_s, broadcast_secs) -> Dict[str, Any]:
+        with self.begin_edit() as s:
+            s.set_position(gps_update_secs=gps_update_secs, use_smart_position=use_smart_position,
+                           smart_min_dist_m=smart_min_dist_m, smart_min_interval_s=smart_min_interval_s,
+                           broadcast_secs=broadcast_secs)
+        return s.result
+
+    def upsert_channel(
+        self,
+        *,
+        index: int,
+        name: Optional[str],
+        gps: Optional[bool],
+        precision_bits: int,
+        uplink: bool,
+        downlink: bool,
+        key_b64: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        with self.begin_edit() as s:
+            s.set_channel(index=index, name=name, gps=gps, precision_bits=precision_bits,
+                          uplink=uplink, downlink=downlink, key_b64=key_b64)
+        return s.result
+
+
+class DeviceEditSession:
+    """
+    Collects edits against a single snapshot and writes them with one apply_from_models call.
+    - set_* methods only mutate the edited copy; None arguments leave a field unchanged
+    - Used as a context manager it commits on a clean exit and discards the edits on an exception
+    """
+
+    def __init__(self, controller: DeviceController, orig: DeviceModel):
+        self._dc = controller
+        self._orig = orig
+        # Copy-on-write: the model itself is copied shallowly and each section is copied the
+        # first time a setter touches it, so untouched sections stay shared with orig
+        self._edited = orig.model_copy()
+        self._copied: set[str] = set()
+        self._committed = False
+        self.result: Optional[Dict[str, Any]] = None
+
+    def __enter__(self) -> "DeviceEditSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and not self._committed:
+            self.commit()
+
+    @property
+    def edited(self) -> DeviceModel:
+        return self._edited
+
+    def commit(self) -> Dict[str, Any]:
+        if self._committed:
+            raise RuntimeError("DeviceEditSession already committed")
+        self._committed = True
+        self.result = self._dc._apply(self._orig, self._edited)
+        return self.result
+
+    def _section(self, name: str, cls):
+        # Sections are Optional on DeviceModel; create an empty one to edit into
+        sec = getattr(self._edited, name)
+        if name not in self._copied:
+            sec = cls() if sec is None else sec.model_copy()
+            setattr(self._edited, name, sec)
+            self._copied.add(name)
+        return sec
+
+    def set_device_role(self, role: str) -> None:
+        self._section("Device", Device).role = role
+
+    def set_owner(self, owner_long: Optional[str], owner_short: Optional[str]) -> None:
+        user = self._section("UserInfo", UserInfo)
         if owner_long is not None:
-            edited.UserInfo["owner"] = owner_long
+            user.longName = owner_long
         if owner_short is not None:
-            edited.UserInfo["shortName"] = owner_short
-        return self.writer.apply_from_models(orig, edited)
+            user.shortName = owner_short
 
-    def upsert_lora(self, *, region, modem_preset, channel_num, hop_limit, tx_enabled, tx_power) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
+    def set_lora(self, *, region=None, modem_preset=None, channel_num=None, hop_limit=None, tx_enabled=None, tx_power=None) -> None:
+        lora = self._section("Lora", Lora)
         if region is not None:
-            edited.Lora["region"] = region
+            lora.region = region
         if modem_preset is not None:
-            edited.Lora["modemPreset"] = modem_preset
+            lora.modemPreset = modem_preset
         if channel_num is not None:
-            edited.Lora["channelNum"] = int(channel_num)
+            lora.channelNum = int(channel_num)
         if hop_limit is not None:
-            edited.Lora["hopLimit"] = int(hop_limit)
+            lora.hopLimit = int(hop_limit)
         if tx_enabled is not None:
-            edited.Lora["txEnabled"] = bool(tx_enabled)
+            lora.txEnabled = bool(tx_enabled)
         if tx_power is not None:
-            edited.Lora["txPower"] = int(tx_power)
-        return self.writer.apply_from_models(orig, edited)
+            lora.txPower = int(tx_power)
 
-    def upsert_power(self, *, light_sleep, wait_bt, min_wake) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
+    def set_power(self, *, light_sleep=None, wait_bt=None, min_wake=None) -> None:
+        power = self._section("Power", Power)
         if light_sleep is not None:
-            edited.Power["lightSleepSeconds"] = int(light_sleep)
+            power.lsSecs = int(light_sleep)
         if wait_bt is not None:
-            edited.Power["waitBluetoothSeconds"] = int(wait_bt)
+            power.waitBluetoothSecs = int(wait_bt)
         if min_wake is not None:
-            edited.Power["minWakeSeconds"] = int(min_wake)
-        return self.writer.apply_from_models(orig, edited)
+            power.minWakeSecs = int(min_wake)
 
-    def upsert_position(self, *, gps_update_secs, use_smart_position, smart_min_dist_m, smart_min_interval_s, broadcast_secs) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
+    def set_position(self, *, gps_update_secs=None, use_smart_position=None, smart_min_dist_m=None, smart_min_interval_s=None, broadcast_secs=None) -> None:
+        pos = self._section("Position", Position)
         if gps_update_secs is not None:
-            edited.Position["gpsUpdateInterval"] = int(gps_update_secs)
+            pos.gpsUpdateInterval = int(gps_update_secs)
         if use_smart_position is not None:
-            edited.Position["useSmartPositioning"] = bool(use_smart_position)
+            pos.positionBroadcastSmartEnabled = bool(use_smart_position)
         if smart_min_dist_m is not None:
-            edited.Position["smartMinimumDistance"] = int(smart_min_dist_m)
+            pos.broadcastSmartMinimumDistance = int(smart_min_dist_m)
         if smart_min_interval_s is not None:
-            edited.Position["smartMinimumInterval"] = int(smart_min_interval_s)
+            pos.broadcastSmartMinimumIntervalSecs = int(smart_min_interval_s)
         if broadcast_secs is not None:
-            edited.Position["positionBroadcastSecs"] = int(broadcast_secs)
-        return self.writer.apply_from_models(orig, edited)
+            pos.positionBroadcastSecs = int(broadcast_secs)
 
-    def upsert_channel(
+    def set_channel(
         self,
         *,
         index: int,
@@ -111,15 +224,19 @@ class DeviceController:
         uplink: bool,
         downlink: bool,
         key_b64: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        orig = self.reader.snapshot()
-        edited = orig.model_copy(deep=True)
+    ) -> None:
+        # Shallow list copy on first touch; the edited channel itself is copied below
+        if "MeshChannels" not in self._copied:
+            self._edited.MeshChannels = list(self._edited.MeshChannels)
+            self._copied.add("MeshChannels")
+        channels = self._edited.MeshChannels
 
         # find or append the channel in edited.MeshChannels
         ch = None
-        for c in edited.MeshChannels:
+        for pos, c in enumerate(channels):
             if int(c.index) == int(index):
-                ch = c
+                ch = c.model_copy()
+                channels[pos] = ch
                 break
         if ch is None:
             # Create a new channel entry (secondary by definition)
@@ -133,7 +250,7 @@ class DeviceController:
                 psk=key_b64,
                 role=None,
             )
-            edited.MeshChannels.append(ch)
+            channels.append(ch)
         else:
             if name is not None:
                 ch.name = name
@@ -141,5 +258,3 @@ class DeviceController:
             ch.downlink_enabled = bool(downlink)
             ch.position_precision = int(precision_bits)
             ch.psk = key_b64
-
-        return self.writer.apply_from_models(orig, edited)
\ No newline at end of file
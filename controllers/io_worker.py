@@ -0,0 +1,57 @@
+# controllers/io_worker.py
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+log = logging.getLogger(__name__)
+
+
+class DeviceIOWorker:
+    """
+    Single daemon thread that runs blocking device jobs (detect, apply, refresh) one at a time.
+      - Jobs are serialized, so two callers never talk to the serial port concurrently
+      - submit() returns a concurrent.futures.Future; pending jobs can be cancelled with future.cancel()
+      - The thread is a daemon, so a job stuck in serial I/O never blocks app exit
+    """
+
+    def __init__(self, name: str = "device-io") -> None:
+        self._q: "queue.Queue[Optional[tuple[Future, Callable[..., Any], tuple, dict]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        if self._closed:
+            raise RuntimeError("DeviceIOWorker is shut down")
+        fut: Future = Future()
+        self._q.put((fut, fn, args, kwargs))
+        return fut
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs, cancel anything still queued and let the thread exit."""
+        self._closed = True
+        try:
+            while True:
+                item = self._q.get_nowait()
+                if item is not None:
+                    item[0].cancel()
+        except queue.Empty:
+            pass
+        self._q.put(None)
+
+    def _run(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            fut, fn, args, kwargs = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                fut.set_exception(e)
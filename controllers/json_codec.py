@@ -0,0 +1,55 @@
+# controllers/json_codec.py
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson is optional; fall back to the stdlib when it is not installed
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def dumps_pretty(obj: Any) -> str:
+    """
+    Serialize obj as indented (2-space) JSON text for display/logging.
+    Non-JSON values are rendered with str(), as json.dumps(default=str) would.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(
+                obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS, default=str
+            ).decode("utf-8")
+        except (TypeError, _orjson.JSONEncodeError):
+            # e.g. integers beyond 64 bits; the stdlib handles those
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize obj as indented (2-space) UTF-8 JSON bytes with a trailing newline, ready for
+    Path.write_bytes(). Non-ASCII text is kept as-is and non-JSON values are rendered with str().
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(
+                obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS | _orjson.OPT_APPEND_NEWLINE, default=str
+            )
+        except (TypeError, _orjson.JSONEncodeError):
+            pass
+    return (json.dumps(obj, indent=2, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse JSON from bytes/str. Uses orjson when installed; falls back to json.loads when
+    orjson is missing or rejects input the stdlib accepts (UTF-8 BOM, NaN/Infinity literals).
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -2,20 +2,43 @@
 from __future__ import annotations
 
 import os
-import json
+import copy
 import logging
+import re
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from controllers.json_codec import dumps_bytes, dumps_pretty, loads as json_loads
+
 log = logging.getLogger(__name__)
 
+# Characters that are broadly problematic in file names (esp. on Windows)
+_INVALID_CHARS = frozenset('<>:"/\\|?*')
+# Windows reserved device names (compared upper-cased)
+_RESERVED = frozenset({"CON", "PRN", "AUX", "NUL", *(f"COM{i}" for i in range(1, 10)), *(f"LPT{i}" for i in range(1, 10))})
+# "PSK": "keyring://<label>" in a saved preset; labels never contain quotes or escapes
+_PSK_TOKEN_RE = re.compile(rb'"PSK"\s*:\s*"keyring://([^"\\]+)"')
+
+
+class _LazyRedact:
+    """Log argument that redacts PSKs and serializes to indented JSON only when formatted."""
+    __slots__ = ("data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return dumps_pretty(PresetController._redact_psks_for_log(self.data))
+
 
 class PresetController:
     """
     File-backed preset manager.
 
     - Creates/uses a hidden directory in the user's HOME (~/.meshtastic_config_presets).
-    - Saves presets as readable JSON (*.json, indent=4).
+    - Saves presets as readable JSON (*.json, indent=2).
     - Lists available presets (by name, without .json).
     - Loads/saves/deletes presets with defensive error handling.
     - If the directory cannot be created, the controller gracefully disables itself
@@ -37,9 +60,17 @@ class PresetController:
         self.preset_dir: Optional[Path] = home / self.PRESET_DIR_NAME
         self._ensure_preset_dir_exists()
 
-        # Try to import keyring lazily and record availability.
+        # stat-keyed caches: directory listing (dir mtime) and parsed preset files (mtime, size)
+        self._names_cache: Optional[tuple[int, List[str]]] = None
+        self._preset_cache: Dict[str, tuple[tuple[int, int], Dict[str, Any]]] = {}
+
+        # Import keyring once and keep the module (and its delete error) for the helpers below.
+        self._kr: Any = None
+        self._kr_delete_error: type[BaseException] = Exception
         try:
-            import keyring  # noqa: F401
+            import keyring
+            self._kr = keyring
+            self._kr_delete_error = keyring.errors.PasswordDeleteError
             self._keyring_ok = True
         except Exception:
             self._keyring_ok = False
@@ -58,7 +89,14 @@ class PresetController:
             log.critical("Failed to create preset directory at %s: %s", self.preset_dir, e)
             self.preset_dir = None  # gracefully disable
 
+    def _invalidate_cache(self, *names: str) -> None:
+        """Drop the cached listing and any cached parse for the given preset names."""
+        self._names_cache = None
+        for n in names:
+            self._preset_cache.pop(n, None)
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def _is_safe_name(name: str) -> bool:
         """Reject names with path separators, reserved names, or illegal characters."""
         if not name or name in (".", ".."):
@@ -69,13 +107,11 @@ class PresetController:
             return False
 
         # Disallow characters that are broadly problematic (esp. on Windows)
-        invalid_chars = set('<>:"/\\|?*')
-        if any(ch in invalid_chars for ch in name):
+        if not _INVALID_CHARS.isdisjoint(name):
             return False
 
         # Windows reserved device names (case-insensitive)
-        reserved = {"CON", "PRN", "AUX", "NUL"} | {f"COM{i}" for i in range(1, 10)} | {f"LPT{i}" for i in range(1, 10)}
-        if name.upper() in reserved:
+        if name.upper() in _RESERVED:
             return False
 
         return True
@@ -89,7 +125,9 @@ class PresetController:
             return None
         return self.preset_dir / f"{name}.json"
 
-    def _clean_name(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _clean_name(name: str) -> str:
         """A little name format and cleaning before it goes through _is_safe_name."""
         try:
             return str(name).title().strip().replace(" ", "")
@@ -112,8 +150,7 @@ class PresetController:
         if not self._keyring_ok or not secret:
             return None
         try:
-            import keyring
-            keyring.set_password(self._KR_SERVICE, label, secret)
+            self._kr.set_password(self._KR_SERVICE, label, secret)
             return self._make_token(label)
         except Exception as e:
             log.warning("Keyring save failed for label '%s': %s", label, e)
@@ -124,9 +161,8 @@ class PresetController:
         if not self._keyring_ok:
             return None
         try:
-            import keyring
             label = self._label_from_token(token_or_label) if self._is_token(token_or_label) else token_or_label
-            return keyring.get_password(self._KR_SERVICE, label)
+            return self._kr.get_password(self._KR_SERVICE, label)
         except Exception as e:
             log.warning("Keyring fetch failed for '%s': %s", token_or_label, e)
             return None
@@ -136,13 +172,12 @@ class PresetController:
         if not self._keyring_ok:
             return False
         try:
-            import keyring
             label = self._label_from_token(token_or_label) if self._is_token(token_or_label) else token_or_label
             # Some backends raise if not present; treat that as success for idempotence
-            keyring.delete_password(self._KR_SERVICE, label)
+            self._kr.delete_password(self._KR_SERVICE, label)
             log.info("[preset] keyring entry removed: %s", label)
             return True
-        except keyring.errors.PasswordDeleteError:
+        except self._kr_delete_error:
             # Already absent
             return True
         except Exception as e:
@@ -152,22 +187,26 @@ class PresetController:
     # ----- Secure PSK transforms -----
     def _secure_psks(self, preset_name: str, preset_data: dict) -> dict:
         """Return a copy of preset_data with PSKs moved to keyring and replaced by tokens."""
-        out: dict = {}
-        for section, fields in (preset_data or {}).items():
-            nf: dict = {}
-            for label, val in (fields or {}).items():
-                if label == "PSK" and isinstance(val, str) and val and not self._is_token(val):
-                    label_key = f"{preset_name}:{section}"
-                    token = self._keyring_save(label_key, val)
-                    if token:
-                        nf[label] = token
-                    else:
-                        # Fallback: keep inline (you can choose to blank instead if you prefer)
-                        log.warning("[preset] keyring unavailable; storing PSK inline for section '%s'", section)
-                        nf[label] = val
-                else:
-                    nf[label] = val
-            out[section] = nf
+        out: dict = {section: dict(fields or {}) for section, fields in (preset_data or {}).items()}
+
+        # Collect the inline PSKs first, then talk to the keyring backend in one pass
+        jobs = [
+            section for section, nf in out.items()
+            if isinstance(nf.get("PSK"), str) and nf["PSK"] and not self._is_token(nf["PSK"])
+        ]
+        if not jobs:
+            return out
+
+        backend_ok = self._keyring_ok
+        for section in jobs:
+            token = self._keyring_save(f"{preset_name}:{section}", out[section]["PSK"]) if backend_ok else None
+            if token:
+                out[section]["PSK"] = token
+            else:
+                # Early-out: once the backend fails, keep the remaining PSKs inline without retrying it
+                backend_ok = False
+                # Fallback: keep inline (you can choose to blank instead if you prefer)
+                log.warning("[preset] keyring unavailable; storing PSK inline for section '%s'", section)
         return out
 
     def _resolve_psks(self, preset_name: str, preset_data: dict) -> dict:
@@ -208,11 +247,18 @@ class PresetController:
         if self.preset_dir is None:
             return []
         try:
-            names: List[str] = []
-            for p in self.preset_dir.iterdir():
-                if p.is_file() and p.suffix.lower() == ".json":
-                    names.append(p.stem)
-            return sorted(names)
+            mtime = os.stat(self.preset_dir).st_mtime_ns
+            if self._names_cache is not None and self._names_cache[0] == mtime:
+                return list(self._names_cache[1])
+            # scandir's DirEntry.is_file() reuses the directory read's file type, so no stat per entry
+            with os.scandir(self.preset_dir) as it:
+                names = [
+                    e.name[:-5] for e in it
+                    if len(e.name) > 5 and e.name[-5:].lower() == ".json" and e.is_file()
+                ]
+            names.sort()
+            self._names_cache = (mtime, names)
+            return list(names)
         except OSError as e:
             log.error("Failed to list preset directory %s: %s", self.preset_dir, e)
             return []
@@ -256,12 +302,12 @@ class PresetController:
             # Ensure directory still exists (it could have been removed externally)
             os.makedirs(self.preset_dir, exist_ok=True)
 
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False, default=str)
-                f.write("\n")
+            # One bytes blob and one write instead of many small writes through a text layer
+            tmp_path.write_bytes(dumps_bytes(settings))
 
             # Atomic replace (works cross-platform on modern Python)
             os.replace(tmp_path, path)
+            self._invalidate_cache(clean_name)
             log.info("Saved preset '%s' to %s", clean_name, path)
             return True
         except (OSError, TypeError, ValueError) as e:
@@ -299,6 +345,7 @@ class PresetController:
 
         try:
             os.rename(old_path, new_path)
+            self._invalidate_cache(old, new)
             log.info("Renamed preset '%s' to '%s'.", old, new)
             return True
         except OSError as e:
@@ -318,22 +365,35 @@ class PresetController:
         if path is None:
             return {}
 
-        if not path.exists() or not path.is_file():
+        # One stat answers "exists", "is a file" and the cache key
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             log.warning("Preset not found: %s", path)
             return {}
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Size guards against a rewrite landing within the filesystem's mtime granularity
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._preset_cache.get(clean_name)
+            if cached is not None and cached[0] == key:
+                data = cached[1]
+            else:
+                # Parse straight from bytes: no text decode/str copy, and orjson when available
+                data = json_loads(path.read_bytes())
+                if isinstance(data, dict):
+                    self._preset_cache[clean_name] = (key, data)
             if isinstance(data, dict):
-                # Redact PSKs in logs
-                log_data = self._redact_psks_for_log(data)
-                log.info("preset '%s' in use. settings: %s", clean_name, json.dumps(log_data, indent=4))
-                return data  # happy path
+                # Redact PSKs in logs; the copy and pretty-print only happen if a handler formats the record
+                log.info("preset '%s' in use. settings: %s", clean_name, _LazyRedact(data))
+                return copy.deepcopy(data)  # happy path; callers never see the cached object
 
             log.error("Preset file is not a JSON object: %s", path)
             return {}
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, ValueError) as e:
+            # ValueError covers json/orjson decode errors and invalid UTF-8
             log.error("Failed to load preset '%s' from %s: %s", clean_name, path, e)
             return {}
 
@@ -357,23 +417,32 @@ class PresetController:
 
         # Attempt to remove any keyring entries referenced by this preset
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict):
-                for section, fields in (data or {}).items():
-                    try:
-                        psk = (fields or {}).get("PSK")
+            raw = path.read_bytes()
+            labels = _PSK_TOKEN_RE.findall(raw)
+            if len(labels) == raw.count(b"keyring://"):
+                tokens = [self._make_token(lbl.decode("utf-8")) for lbl in labels]
+            else:
+                # A token the regex could not read cleanly (escapes, odd layout): parse the file
+                data = json_loads(raw)
+                tokens = []
+                if isinstance(data, dict):
+                    for fields in data.values():
+                        psk = fields.get("PSK") if isinstance(fields, dict) else None
                         if isinstance(psk, str) and self._is_token(psk):
-                            # Labels were stored as f"{preset}:{section}"
-                            self._keyring_delete(psk)
-                    except Exception:
-                        pass
+                            tokens.append(psk)
+            for token in tokens:
+                # Labels were stored as f"{preset}:{section}"
+                try:
+                    self._keyring_delete(token)
+                except Exception:
+                    pass
         except Exception:
             # Non-fatal; continue with file deletion
             pass
 
         try:
             os.remove(path)
+            self._invalidate_cache(clean_name)
             log.info("Deleted preset '%s' at %s", clean_name, path)
             return True
         except OSError as e:
@@ -1,8 +1,10 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=64)
 def resource_path(rel: str) -> str:
-    """Return absolute path to resource for both dev and PyInstaller-frozen builds."""
+    """Return absolute path to resource for both dev and PyInstaller-frozen builds (memoized per rel)."""
     if hasattr(sys, "_MEIPASS"):
         return str(Path(sys._MEIPASS) / rel)  # PyInstaller temp dir
     # repo root / same dir as app.py
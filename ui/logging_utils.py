@@ -1,17 +1,98 @@
 # ui/logging_utils.py
 from __future__ import annotations
 import logging
-import queue
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+class UIFormatter(logging.Formatter):
+    """
+    Formatter tuned for the UI log box.
+    - With the default "%(message)s" format, records without args or exception info
+      return record.msg as-is (no %-formatting, no LogRecord attribute lookups).
+    - formatTime caches the strftime() part per wall-clock second, for formats using %(asctime)s.
+    """
+    _time_cache: tuple[int, str] = (-1, "")
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt, datefmt)
+        self._message_only = fmt in (None, "%(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self._message_only and not record.args and not record.exc_info and not record.stack_info:
+            record.message = msg = str(record.msg)
+            return msg
+        return super().format(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        sec = int(record.created)
+        cached_sec, cached = self._time_cache
+        if sec != cached_sec:
+            cached = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+            self._time_cache = (sec, cached)
+        if datefmt:
+            return cached
+        return self.default_msec_format % (cached, record.msecs)
+
+
+class LogBuffer:
+    """
+    Thread-safe FIFO of formatted log lines for the UI.
+    push() from a worker thread only appends: a Tk call from a non-Tk thread blocks until the
+    Tk thread services it, which can deadlock while the Tk thread waits on that worker. The UI
+    picks those lines up with its own after() polling. On the Tk thread, if a widget is given,
+    push() posts one <<LogArrived>> virtual event when the buffer goes from drained to non-empty;
+    drain() re-arms the wake.
+    """
+    def __init__(self, tk_widget=None):
+        self._dq: deque[str] = deque()
+        self.widget = tk_widget
+        self._wake_pending = False
+
+    def push(self, msg: str):
+        self._dq.append(msg)
+        if self._wake_pending or self.widget is None or threading.current_thread() is not threading.main_thread():
+            return
+        self._wake_pending = True
+        try:
+            self.widget.event_generate("<<LogArrived>>", when="tail")
+        except Exception:
+            # Widget destroyed or main loop not running yet; the UI watchdog picks it up
+            pass
+
+    def drain(self, limit: Optional[int] = None) -> List[str]:
+        """Pop up to `limit` lines (oldest first); limit=None pops everything buffered."""
+        # Re-arm before popping: anything pushed from here on either gets drained now or wakes us again
+        self._wake_pending = False
+        out: List[str] = []
+        pop = self._dq.popleft
+        if limit is None:
+            try:
+                while True:
+                    out.append(pop())
+            except IndexError:
+                pass
+            return out
+        try:
+            while len(out) < limit:
+                out.append(pop())
+        except IndexError:
+            pass
+        return out
+
 
 class QueueLogHandler(logging.Handler):
-    """Push logging records to a thread-safe queue for the UI to pull."""
-    def __init__(self, q: queue.Queue):
+    """
+    Push formatted logging records into a LogBuffer for the UI to drain.
+    """
+    def __init__(self, buf: LogBuffer):
         super().__init__()
-        self.q = q
+        self.buf = buf
+        self.setFormatter(UIFormatter())
 
     def emit(self, record: logging.LogRecord):
         try:
-            msg = self.format(record)
-            self.q.put_nowait(msg)
+            self.buf.push(self.format(record))
         except Exception:
-            pass
+            return
@@ -1,25 +1,49 @@
 # ui/panels/base_panel.py
 from __future__ import annotations
 import customtkinter as ctk
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 class BasePanel:
     """
     Minimal contract for panels:
     - build(parent_frame): create UI and variables on self
     - apply_model(model): populate variables from DeviceModel
-    - collect_model_overlay(base_model): mutate base_model with fields from this panel (same way app.py did)
+    - collect_model_overlay(base_model): return a model with this panel's section(s) replaced by fresh
+      copies (base_model.model_copy(update=...)); never mutate base_model's sections in place, since
+      app.py only makes a shallow copy of the original snapshot
     - preset_bindings(): mapping { display section -> { label -> ctk.Variable } }
     - preset_apply(section_fields: Dict[str, Any]): set only provided fields
+    - preset_apply_section(section, fields): same for a single section (app.py dispatches through this)
+    - model_sections: DeviceModel fields apply_model reads; empty means "always re-apply"
     """
     section_title: str = ""
+    model_sections: tuple[str, ...] = ()
 
     def __init__(self, app: "ctk.CTk"):
         self.app = app
         self.frame: ctk.CTkFrame | None = None
+        self._flat_bindings: Optional[List[Tuple[str, str, Any]]] = None
 
     def build(self, parent: ctk.CTkFrame): ...
     def apply_model(self, model): ...
     def collect_model_overlay(self, base_model): ...
     def preset_bindings(self) -> Dict[str, Dict[str, Any]]: ...
     def preset_apply(self, section_fields: Dict[str, Any]): ...
+
+    def preset_apply_section(self, section: str, fields: Dict[str, Any]):
+        """Apply one preset section. Panels that handle sections one at a time override this."""
+        return self.preset_apply({section: fields})
+
+    def flat_bindings(self) -> List[Tuple[str, str, Any]]:
+        """(section, label, variable) triples from preset_bindings(), cached until invalidate_bindings()."""
+        if self._flat_bindings is None:
+            self._flat_bindings = [
+                (section, label, var)
+                for section, controls in self.preset_bindings().items()
+                for label, var in controls.items()
+            ]
+        return self._flat_bindings
+
+    def invalidate_bindings(self):
+        """Call when the set of bound variables changes (e.g. rows added/removed)."""
+        self._flat_bindings = None
@@ -14,6 +14,7 @@ BLUETOOTH_MODES = ["RANDOM_PIN", "FIXED_PIN", "NO_PIN"]
 
 class BluetoothPanel(BasePanel):
     section_title = "Bluetooth"
+    model_sections = ("BlueTooth",)
     
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, self.section_title, open=False)
@@ -103,10 +104,12 @@ class BluetoothPanel(BasePanel):
         
         try:
             if m.BlueTooth:
-                setattr(m.BlueTooth, "enabled", bool(self.var_bt_enabled.get()))
-                setattr(m.BlueTooth, "mode", self.var_bt_mode.get() or "RANDOM_PIN")
+                bt = m.BlueTooth.model_copy()
+                setattr(bt, "enabled", bool(self.var_bt_enabled.get()))
+                setattr(bt, "mode", self.var_bt_mode.get() or "RANDOM_PIN")
                 pin_str = self.var_bt_fixed_pin.get()
-                setattr(m.BlueTooth, "fixedPin", _to_int_or_none(pin_str) if pin_str.isdigit() else pin_str)
+                setattr(bt, "fixedPin", _to_int_or_none(pin_str) if pin_str.isdigit() else pin_str)
+                return m.model_copy(update={"BlueTooth": bt})
 
         except Exception:
             pass
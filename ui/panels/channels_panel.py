@@ -9,6 +9,7 @@ from models.device_model import MeshChannel
 
 class ChannelsPanel(BasePanel):
     section_title = "Channels"
+    model_sections = ("MeshChannels",)
 
     def __init__(self, app: "ctk.CTk"):
         super().__init__(app)
@@ -57,6 +58,7 @@ class ChannelsPanel(BasePanel):
             cf0 = ChannelFrame(self.frame, index=0, is_primary=True)
             cf0.pack(fill="x", padx=6, pady=4)
             self._channel_frames.append(cf0)
+            self._bindings_changed()
         ch0 = next((c for c in channels if getattr(c, "index", 0) == 0), None)
         self._apply_channel_to_frame(cf0, ch0)
 
@@ -130,6 +132,11 @@ class ChannelsPanel(BasePanel):
         return out
 
 
+    def _bindings_changed(self):
+        """Rows were added/removed: drop cached bindings here and in the app's section index."""
+        self.invalidate_bindings()
+        self.app._invalidate_section_index()
+
     def preset_bindings(self) -> Dict[str, Dict[str, Any]]:
         bindings = {}
         for cf in self._channel_frames:
@@ -145,23 +152,26 @@ class ChannelsPanel(BasePanel):
 
     def preset_apply(self, section_fields: Dict[str, Any]):
         for section, fields in section_fields.items():
-            idx = -1
-            if section == "Primary Channel": idx = 0
-            elif section.startswith("Channel "):
-                try: idx = int(section.split(" ")[1])
-                except (ValueError, IndexError): continue
-            
-            if idx >= 1: # Auto-add any non-primary channel from a preset
+            self.preset_apply_section(section, fields)
+
+    def preset_apply_section(self, section: str, fields: Dict[str, Any]):
+        idx = -1
+        if section == "Primary Channel": idx = 0
+        elif section.startswith("Channel "):
+            try: idx = int(section.split(" ")[1])
+            except (ValueError, IndexError): return
+
+        if idx >= 1: # Auto-add any non-primary channel from a preset
+            cf = self._get_channel_frame(idx)
+            if not cf:
+                self._add_channel_row(index=idx)
                 cf = self._get_channel_frame(idx)
-                if not cf:
-                    self._add_channel_row(index=idx)
-                    cf = self._get_channel_frame(idx)
-                if cf:
-                    self._apply_fields_to_frame(cf, fields)
-            elif idx == 0: # Apply to existing primary
-                cf = self._get_channel_frame(0)
-                if cf:
-                    self._apply_fields_to_frame(cf, fields)
+            if cf:
+                self._apply_fields_to_frame(cf, fields)
+        elif idx == 0: # Apply to existing primary
+            cf = self._get_channel_frame(0)
+            if cf:
+                self._apply_fields_to_frame(cf, fields)
     
 
     def _apply_fields_to_frame(self, cf: ChannelFrame, fields: Dict[str, Any]):
@@ -204,6 +214,7 @@ class ChannelsPanel(BasePanel):
                     pass
         # Keep only the primary reference
         self._channel_frames = [cf for cf in self._channel_frames if cf.index == 0 and cf.winfo_exists()]
+        self._bindings_changed()
 
 
     def _on_add_channel_clicked(self):
@@ -220,6 +231,7 @@ class ChannelsPanel(BasePanel):
         new_cf = ChannelFrame(self._channels_container, index=index, delete_callback=lambda idx=index: self._delete_channel_row(idx))
         new_cf.pack(fill="x", padx=6, pady=4)
         self._channel_frames.append(new_cf)
+        self._bindings_changed()
         if model:
             self._apply_channel_to_frame(new_cf, model)
 
@@ -229,6 +241,7 @@ class ChannelsPanel(BasePanel):
         if frame_to_delete:
             frame_to_delete.destroy()
             self._channel_frames = [cf for cf in self._channel_frames if cf.index != index_to_delete]
+            self._bindings_changed()
 
 
     def _get_channel_frame(self, index: int) -> ChannelFrame | None:
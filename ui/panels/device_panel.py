@@ -11,6 +11,7 @@ from .base_panel import BasePanel
 
 class DevicePanel(BasePanel):
     section_title = "Device"
+    model_sections = ("Device", "UserInfo")
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, "Device", open=True)
@@ -63,20 +64,25 @@ class DevicePanel(BasePanel):
             self.var_role.set(getattr(model.Device, "role", None) or "CLIENT")
 
     def collect_model_overlay(self, m):
+        update = {}
         try:
             if m.Device:
-                setattr(m.Device, "role", self.var_role.get().strip() or "CLIENT")
+                device = m.Device.model_copy()
+                setattr(device, "role", self.var_role.get().strip() or "CLIENT")
+                update["Device"] = device
         except Exception:
             pass
         try:
             if m.UserInfo:
-                setattr(m.UserInfo, "longName", self.var_owner_long.get().strip() or None)
-                setattr(m.UserInfo, "shortName", self.var_owner_short.get().strip() or None)
-                if hasattr(m.UserInfo, "owner"):
-                    setattr(m.UserInfo, "owner", self.var_owner_long.get().strip() or None)
+                user = m.UserInfo.model_copy()
+                setattr(user, "longName", self.var_owner_long.get().strip() or None)
+                setattr(user, "shortName", self.var_owner_short.get().strip() or None)
+                if hasattr(user, "owner"):
+                    setattr(user, "owner", self.var_owner_long.get().strip() or None)
+                update["UserInfo"] = user
         except Exception:
             pass
-        return m
+        return m.model_copy(update=update) if update else m
 
     @property
     def _bindings(self) -> Dict[str, ctk.Variable]:
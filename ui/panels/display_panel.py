@@ -30,6 +30,7 @@ DISPLAY_MODES = ["DEFAULT", "TWOCOLOR", "INVERTED", "COLOR"]
 
 class DisplayPanel(BasePanel):
     section_title = "Display"
+    model_sections = ("Display",)
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, self.section_title, open=False)
@@ -124,23 +125,25 @@ class DisplayPanel(BasePanel):
 
         try:
             if m.Display:
+                disp = m.Display.model_copy()
                 screen_secs = _to_int_or_none(self.var_disp_screen_secs.get())
-                if screen_secs is not None: setattr(m.Display, "screenOnSecs", screen_secs)
+                if screen_secs is not None: setattr(disp, "screenOnSecs", screen_secs)
                 
                 carousel_secs = _to_int_or_none(self.var_disp_auto_carousel.get())
-                if carousel_secs is not None: setattr(m.Display, "autoScreenCarouselSecs", carousel_secs)
+                if carousel_secs is not None: setattr(disp, "autoScreenCarouselSecs", carousel_secs)
                 
-                setattr(m.Display, "gpsFormat", self.var_disp_gps_fmt.get() or None)
-                setattr(m.Display, "units", self.var_disp_units.get() or None)
-                setattr(m.Display, "oled", self.var_disp_oled.get() or None)
-                setattr(m.Display, "displaymode", self.var_disp_mode.get() or None)
-                setattr(m.Display, "compassOrientation", self.var_disp_compass_orientation.get() or None)
+                setattr(disp, "gpsFormat", self.var_disp_gps_fmt.get() or None)
+                setattr(disp, "units", self.var_disp_units.get() or None)
+                setattr(disp, "oled", self.var_disp_oled.get() or None)
+                setattr(disp, "displaymode", self.var_disp_mode.get() or None)
+                setattr(disp, "compassOrientation", self.var_disp_compass_orientation.get() or None)
                 
-                setattr(m.Display, "headingBold", bool(self.var_disp_heading_bold.get()))
-                setattr(m.Display, "flipScreen", bool(self.var_disp_flip.get()))
-                setattr(m.Display, "compassNorthTop", bool(self.var_disp_north_top.get()))
-                setattr(m.Display, "wakeOnTapOrMotion", bool(self.var_disp_wake_on_motion.get()))
-                setattr(m.Display, "use12hClock", bool(self.var_disp_use12h.get()))
+                setattr(disp, "headingBold", bool(self.var_disp_heading_bold.get()))
+                setattr(disp, "flipScreen", bool(self.var_disp_flip.get()))
+                setattr(disp, "compassNorthTop", bool(self.var_disp_north_top.get()))
+                setattr(disp, "wakeOnTapOrMotion", bool(self.var_disp_wake_on_motion.get()))
+                setattr(disp, "use12hClock", bool(self.var_disp_use12h.get()))
+                return m.model_copy(update={"Display": disp})
         except Exception:
             pass # Or log error
         return m
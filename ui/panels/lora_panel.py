@@ -12,6 +12,7 @@ REGION_NAMES=['BR_902', 'LORA_24', 'PH_915', 'EU_433', 'RU', 'MY_919', 'NP_865',
 MODEM_PRESET_NAMES=['MEDIUM_FAST', 'LONG_SLOW', 'MEDIUM_SLOW', 'SHORT_FAST', 'SHORT_TURBO', 'VERY_LONG_SLOW', 'LONG_FAST', 'SHORT_SLOW', 'LONG_MODERATE']
 class LoRaPanel(BasePanel):
     section_title = "LoRa"
+    model_sections = ("Lora",)
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, "LoRa", open=False)
@@ -88,15 +89,17 @@ class LoRaPanel(BasePanel):
     def collect_model_overlay(self, m):
         try:
             if m.Lora:
-                setattr(m.Lora, "region", self.var_region.get().strip() or None)
-                setattr(m.Lora, "modemPreset", self.var_modem.get().strip() or None)
+                lora = m.Lora.model_copy()
+                setattr(lora, "region", self.var_region.get().strip() or None)
+                setattr(lora, "modemPreset", self.var_modem.get().strip() or None)
                 chn = self._to_int_or_none(self.var_channel_num.get())
-                if chn is not None: setattr(m.Lora, "channelNum", int(chn))
+                if chn is not None: setattr(lora, "channelNum", int(chn))
                 hl = self._to_int_or_none(self.var_hop_limit.get())
-                if hl is not None: setattr(m.Lora, "hopLimit", int(hl))
+                if hl is not None: setattr(lora, "hopLimit", int(hl))
                 tp = self._to_int_or_none(self.var_tx_power.get())
-                if tp is not None: setattr(m.Lora, "txPower", int(tp))
-                setattr(m.Lora, "txEnabled", bool(self.var_tx_enabled.get()))
+                if tp is not None: setattr(lora, "txPower", int(tp))
+                setattr(lora, "txEnabled", bool(self.var_tx_enabled.get()))
+                return m.model_copy(update={"Lora": lora})
         except Exception:
             pass
         return m
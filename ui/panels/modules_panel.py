@@ -18,6 +18,7 @@ SERIAL_BAUDS = ["BAUD_DEFAULT", "BAUD_110", "BAUD_300", "BAUD_600", "BAUD_1200",
 
 class ModulesPanel(BasePanel):
     section_title = "Modules"
+    model_sections = ("ModuleConfig",)
 
     def _to_int_or_none(self, s: str) -> Optional[int]:
         try:
@@ -444,6 +445,10 @@ class ModulesPanel(BasePanel):
         if mc is None:
             return m  # nothing to update
 
+        # Only this section is deep-copied; the rest of m stays shared with the caller's snapshot
+        mc = mc.model_copy(deep=True)
+        m = m.model_copy(update={"ModuleConfig": mc})
+
         def _to_int_or_none(s: str) -> Optional[int]:
             try:
                 return None if s is None or str(s).strip() == "" else int(str(s).strip())
@@ -612,15 +617,21 @@ class ModulesPanel(BasePanel):
     def preset_apply(self, section_fields: Dict[str, Any]):
         all_bindings = self.preset_bindings()
         for section_key, fields in section_fields.items():
-            if section_key in all_bindings:
-                module_bindings = all_bindings[section_key]
-                for label, value in fields.items():
-                    var = module_bindings.get(label)
-                    if var:
-                        try:
-                            if isinstance(var, ctk.BooleanVar):
-                                var.set(bool(value))
-                            else:
-                                var.set("" if value is None else str(value))
-                        except Exception:
-                            pass
+            self._apply_module_fields(all_bindings.get(section_key), fields)
+
+    def preset_apply_section(self, section: str, fields: Dict[str, Any]):
+        self._apply_module_fields(self.preset_bindings().get(section), fields)
+
+    def _apply_module_fields(self, module_bindings: Optional[Dict[str, Any]], fields: Dict[str, Any]):
+        if not module_bindings:
+            return
+        for label, value in fields.items():
+            var = module_bindings.get(label)
+            if var:
+                try:
+                    if isinstance(var, ctk.BooleanVar):
+                        var.set(bool(value))
+                    else:
+                        var.set("" if value is None else str(value))
+                except Exception:
+                    pass
@@ -13,6 +13,7 @@ from ui.panels.base_panel import BasePanel
 ADDRESS_MODES=["DHCP", "STATIC"]
 class NetworkPanel(BasePanel):
     section_title = "Network"
+    model_sections = ("Network",)
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, self.section_title, open=False)
@@ -99,12 +100,14 @@ class NetworkPanel(BasePanel):
     def collect_model_overlay(self, m: DeviceModel) -> DeviceModel:
         try:
             if m.Network:
-                setattr(m.Network, "ntpServer", self.var_net_ntp.get() or None)
-                setattr(m.Network, "wifiEnabled", bool(self.var_net_wifi_enabled.get()))
-                setattr(m.Network, "wifiSsid", self.var_net_wifi_ssid.get() or None)
-                setattr(m.Network, "wifiPsk", self.var_net_wifi_psk.get() or None)
-                setattr(m.Network, "ethEnabled", bool(self.var_net_eth_enabled.get()))
-                setattr(m.Network, "addressMode", self.var_address_mode.get() or None)
+                network = m.Network.model_copy()
+                setattr(network, "ntpServer", self.var_net_ntp.get() or None)
+                setattr(network, "wifiEnabled", bool(self.var_net_wifi_enabled.get()))
+                setattr(network, "wifiSsid", self.var_net_wifi_ssid.get() or None)
+                setattr(network, "wifiPsk", self.var_net_wifi_psk.get() or None)
+                setattr(network, "ethEnabled", bool(self.var_net_eth_enabled.get()))
+                setattr(network, "addressMode", self.var_address_mode.get() or None)
+                return m.model_copy(update={"Network": network})
         except Exception:
             pass
         return m
@@ -12,6 +12,7 @@ from ui.validator import Validator
 
 class PositionPanel(BasePanel):
     section_title = "Position"
+    model_sections = ("Position",)
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, self.section_title, open=False)
@@ -94,24 +95,26 @@ class PositionPanel(BasePanel):
 
         try:
             if m.Position:
+                position = m.Position.model_copy()
                 gps = _to_int_or_none(self.var_gps_update.get())
                 if gps is not None:
-                    setattr(m.Position, "gpsUpdateInterval", gps)
+                    setattr(position, "gpsUpdateInterval", gps)
 
                 use_smart = bool(self.var_use_smart.get())
-                setattr(m.Position, "positionBroadcastSmartEnabled", use_smart)
+                setattr(position, "positionBroadcastSmartEnabled", use_smart)
 
                 dist = _to_int_or_none(self.var_smart_dist.get())
                 if dist is not None:
-                    setattr(m.Position, "broadcastSmartMinimumDistance", dist)
+                    setattr(position, "broadcastSmartMinimumDistance", dist)
 
                 inter = _to_int_or_none(self.var_smart_interval.get())
                 if inter is not None:
-                    setattr(m.Position, "broadcastSmartMinimumIntervalSecs", inter)
+                    setattr(position, "broadcastSmartMinimumIntervalSecs", inter)
 
                 bcast = _to_int_or_none(self.var_broadcast_secs.get())
                 if bcast is not None:
-                    setattr(m.Position, "positionBroadcastSecs", bcast)
+                    setattr(position, "positionBroadcastSecs", bcast)
+                return m.model_copy(update={"Position": position})
         except Exception:
             pass
         return m
@@ -11,6 +11,7 @@ from ui.validator import Validator
 
 class PowerPanel(BasePanel):
     section_title = "Power"
+    model_sections = ("Power",)
 
     def build(self, parent: ctk.CTkFrame):
         _, self.frame, _ = make_collapsible(parent, self.section_title, open=False)
@@ -49,15 +50,17 @@ class PowerPanel(BasePanel):
                 
         try:
             if m.Power:
+                power = m.Power.model_copy()
                 ls = _to_int_or_none(self.var_light_sleep.get())
                 wb = _to_int_or_none(self.var_wait_bt.get())
                 mw = _to_int_or_none(self.var_min_wake.get())
                 if ls is not None:
-                    if hasattr(m.Power, "lsSecs"): setattr(m.Power, "lsSecs", ls)
+                    if hasattr(power, "lsSecs"): setattr(power, "lsSecs", ls)
                 if wb is not None:
-                    if hasattr(m.Power, "waitBluetoothSecs"): setattr(m.Power, "waitBluetoothSecs", wb)
+                    if hasattr(power, "waitBluetoothSecs"): setattr(power, "waitBluetoothSecs", wb)
                 if mw is not None:
-                    if hasattr(m.Power, "minWakeSecs"): setattr(m.Power, "minWakeSecs", mw)
+                    if hasattr(power, "minWakeSecs"): setattr(power, "minWakeSecs", mw)
+                return m.model_copy(update={"Power": power})
         except Exception:
             pass
         return m